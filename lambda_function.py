@@ -1,9 +1,14 @@
 import json
 import logging
 from src.api_handler import handle_request
+from src.config import IS_LAMBDA, LOG_LEVEL, warm_up_s3_connection
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(LOG_LEVEL)
+
+# コールドスタート時（初期化フェーズ）にS3クライアントと署名処理を準備しておく
+if IS_LAMBDA:
+    warm_up_s3_connection()
 
 def lambda_handler(event, context):
     """AWS Lambda関数ハンドラー
@@ -15,6 +20,8 @@ def lambda_handler(event, context):
     Returns:
         dict: API Gatewayレスポンス
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    # イベント全体のシリアライズはDEBUG時のみ行う
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
     
     return handle_request(event, context)
@@ -1,10 +1,16 @@
 import os
 import json
+import base64
 import logging
 import glob
+import threading
+from urllib.parse import quote
 from flask import Flask, request, send_from_directory, jsonify, Response
 from src.api_handler import handle_request
-from src.config import LOCAL_HOST, LOCAL_PORT, LOCAL_AUDIO_DIR, LOCAL_DATA_DIR
+from src.config import (
+    LOCAL_HOST, LOCAL_PORT, LOCAL_AUDIO_DIR, LOCAL_DATA_DIR,
+    LOCAL_AUDIO_ACCEL_REDIRECT
+)
 
 # ロギング設定
 logging.basicConfig(
@@ -16,6 +22,82 @@ logger = logging.getLogger('local_server')
 # Flaskアプリケーション初期化
 app = Flask(__name__)
 
+# 音声ファイル索引（(ディレクトリ更新時刻, mp3ファイル名一覧, 記事ID -> ファイル名)）
+_audio_index = (None, [], {})
+_audio_index_lock = threading.Lock()
+
+
+def get_audio_index():
+    """local_audioディレクトリの音声ファイル索引を取得
+
+    ディレクトリの更新時刻が変わった場合のみ再スキャンする。
+
+    Returns:
+        tuple: (ディレクトリ更新時刻, mp3ファイル名一覧, 記事ID -> ファイル名の辞書)
+    """
+    global _audio_index
+
+    with _audio_index_lock:
+        try:
+            mtime_ns = os.stat(LOCAL_AUDIO_DIR).st_mtime_ns
+            if _audio_index[0] != mtime_ns:
+                # os.scandirはエントリ種別をキャッシュしているため、追加のstatなしでファイルのみに絞り込める
+                # ドットファイル（macOSのAppleDouble "._xxx.mp3"など）は音声ではないので除外
+                with os.scandir(LOCAL_AUDIO_DIR) as entries:
+                    audio_files = [entry.name for entry in entries
+                                   if not entry.name.startswith('.')
+                                   and entry.name.endswith('.mp3')
+                                   and entry.is_file()]
+                _audio_index = (mtime_ns, audio_files, {})
+                logger.info("Indexed %d audio files in %s", len(audio_files), LOCAL_AUDIO_DIR)
+        except OSError as e:
+            logger.error("Error listing audio directory: %s", e)
+            _audio_index = (None, [], {})
+        return _audio_index
+
+
+def find_article_audio(article_id):
+    """記事IDに対応する音声ファイル名を探す
+
+    Args:
+        article_id: 記事ID
+
+    Returns:
+        str: 音声ファイル名（見つからない場合はNone）
+    """
+    _, audio_files, by_article = get_audio_index()
+    filename = by_article.get(article_id)
+    if filename is None:
+        # 簡単な実装として、article_idがファイル名に含まれる最初のファイルを使用
+        filename = next((f for f in audio_files if article_id in f), None)
+        if filename is not None:
+            # 見つかった場合のみ記録する（存在しないIDで索引が大きくならないように）
+            with _audio_index_lock:
+                by_article[article_id] = filename
+    return filename
+
+
+def send_audio_file(filename):
+    """音声ファイルのレスポンスを返す
+
+    LOCAL_AUDIO_ACCEL_REDIRECTが設定されている場合は、ファイル本体の転送を
+    nginxに任せ（X-Accel-Redirect）、Pythonではバイト列を扱わない。
+
+    Args:
+        filename: LOCAL_AUDIO_DIRからの相対パス
+
+    Returns:
+        Response: Flaskレスポンス
+    """
+    if LOCAL_AUDIO_ACCEL_REDIRECT:
+        location = LOCAL_AUDIO_ACCEL_REDIRECT.rstrip('/') + '/' + quote(filename)
+        return Response(status=200, mimetype='audio/mpeg',
+                        headers={'X-Accel-Redirect': location})
+
+    # conditional=TrueでRangeリクエストはWerkzeugが処理する
+    return send_from_directory(LOCAL_AUDIO_DIR, filename, conditional=True,
+                               as_attachment=False, mimetype='audio/mpeg')
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -23,100 +105,88 @@ def health_check():
     return jsonify({"status": "OK", "service": "news-audio-api"})
 
 
-@app.route('/api/episodes', methods=['GET'])
-def get_episodes():
-    """エピソード一覧取得エンドポイント"""
-    event = {
-        'path': '/api/episodes',
+def make_event(path):
+    """現在のFlaskリクエストからAPI Gateway形式のイベントを構築
+
+    Args:
+        path: API Gatewayに渡すパス
+
+    Returns:
+        dict: API Gatewayイベント
+    """
+    return {
+        'path': path,
         'httpMethod': 'GET',
         'headers': dict(request.headers),
         'queryStringParameters': request.args.to_dict()
     }
-    response = handle_request(event)
 
-    # Lambda形式のレスポンスをFlask形式に変換
+
+def relay(event):
+    """api_handlerにイベントを渡し、Lambda形式のレスポンスをFlask形式に変換
+
+    Args:
+        event: API Gatewayイベント
+
+    Returns:
+        Response: Flaskレスポンス
+    """
+    response = handle_request(event)
+    body = response.get('body', '{}')
+    # gzip圧縮などのバイナリレスポンスはBase64エンコードされている
+    if response.get('isBase64Encoded'):
+        body = base64.b64decode(body)
     return Response(
-        response=response.get('body', '{}'),
+        response=body,
         status=response.get('statusCode', 200),
         headers=response.get('headers', {}),
         mimetype='application/json'
     )
 
 
+@app.route('/api/episodes', methods=['GET'])
+def get_episodes():
+    """エピソード一覧取得エンドポイント"""
+    return relay(make_event('/api/episodes'))
+
+
 @app.route('/api/episodes/<episode_id>', methods=['GET'])
 def get_episode(episode_id):
     """特定エピソード取得エンドポイント"""
-    event = {
-        'path': f'/api/episodes/{episode_id}',
-        'httpMethod': 'GET',
-        'headers': dict(request.headers),
-        'queryStringParameters': request.args.to_dict()
-    }
-    response = handle_request(event)
-
-    # Lambda形式のレスポンスをFlask形式に変換
-    return Response(
-        response=response.get('body', '{}'),
-        status=response.get('statusCode', 200),
-        headers=response.get('headers', {}),
-        mimetype='application/json'
-    )
+    return relay(make_event(f'/api/episodes/{episode_id}'))
 
 
 @app.route('/audio/<path:filename>', methods=['GET'])
 def serve_audio(filename):
     """音声ファイル配信エンドポイント (旧形式)"""
-    logger.info(f"Serving audio file: {filename}")
-    # 音声ファイルを部分的に読み込む場合のヘッダー設定
-    headers = {}
-    if request.headers.get('Range'):
-        headers['Range'] = request.headers.get('Range')
+    logger.info("Serving audio file: %s", filename)
 
     audio_path = os.path.join(LOCAL_AUDIO_DIR, filename)
     if not os.path.exists(audio_path):
-        logger.warning(f"Audio file not found: {audio_path}")
+        logger.warning("Audio file not found: %s", audio_path)
         return jsonify({"error": f"Audio file {filename} not found"}), 404
 
     try:
-        return send_from_directory(LOCAL_AUDIO_DIR, filename, conditional=True,
-                                   as_attachment=False, mimetype='audio/mpeg', headers=headers)
+        return send_audio_file(filename)
     except Exception as e:
-        logger.error(f"Error serving audio file {filename}: {str(e)}")
+        logger.error("Error serving audio file %s: %s", filename, e)
         return jsonify({"error": f"Error serving audio file: {str(e)}"}), 500
 
 
 @app.route('/api/articles/<article_id>/audio', methods=['GET'])
 def get_article_audio(article_id):
     """記事の音声ファイル配信エンドポイント (本番と同じ形式)"""
-    logger.info(f"Requested audio for article: {article_id}")
+    logger.info("Requested audio for article: %s", article_id)
     language = request.args.get('language', 'ja')
 
-    # まずlocal_audioディレクトリ内のファイルを一覧
-    try:
-        audio_files = os.listdir(LOCAL_AUDIO_DIR)
-        logger.info(f"Available audio files: {audio_files}")
-    except Exception as e:
-        logger.error(f"Error listing audio directory: {str(e)}")
-        audio_files = []
-
-    # 簡単な実装として、article_idがファイル名に含まれるファイルを探す
-    matching_files = [
-        f for f in audio_files if article_id in f and f.endswith('.mp3')]
-
-    if matching_files:
-        filename = matching_files[0]  # 最初に見つかったファイルを使用
-        logger.info(f"Found matching audio file: {filename}")
+    filename = find_article_audio(article_id)
 
-        # 音声ファイルを部分的に読み込む場合のヘッダー設定
-        headers = {}
-        if request.headers.get('Range'):
-            headers['Range'] = request.headers.get('Range')
-
-        return send_from_directory(LOCAL_AUDIO_DIR, filename, conditional=True,
-                                   as_attachment=False, mimetype='audio/mpeg', headers=headers)
+    if filename:
+        logger.info("Found matching audio file: %s", filename)
+        return send_audio_file(filename)
     else:
         logger.warning(
-            f"No matching audio file found for article_id: {article_id}")
+            "No matching audio file found for article_id: %s", article_id)
         return jsonify({"error": f"Audio file for article {article_id} not found"}), 404
 
 
@@ -144,8 +214,19 @@ def ensure_directories():
         logger.warning(f"エピソード一覧ファイルが見つかりません: {episodes_list_file}")
 
 
+def warm_up():
+    """起動時に索引とキャッシュを構築し、初回リクエストの遅延をなくす"""
+    get_audio_index()
+    # エピソード一覧を一度読み込み、api_handler側のキャッシュを温めておく
+    handle_request({'path': '/api/episodes', 'httpMethod': 'GET'})
+
+
+# 起動時に一度だけ実行（gunicorn等のWSGIサーバーから読み込まれた場合も含む）
+# gunicornの--preload指定時は、フォーク前に構築したキャッシュをワーカー間で共有できる
+ensure_directories()
+warm_up()
+
 if __name__ == '__main__':
-    ensure_directories()
     logger.info(f"ローカルサーバーを起動します: http://{LOCAL_HOST}:{LOCAL_PORT}")
     logger.info(f"データディレクトリ: {LOCAL_DATA_DIR}")
     logger.info(f"音声ファイルディレクトリ: {LOCAL_AUDIO_DIR}")
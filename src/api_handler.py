@@ -1,22 +1,89 @@
+import base64
+import gzip
+import hashlib
 import json
 import os
+import re
 import logging
-import boto3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from botocore.exceptions import ClientError
-import traceback
+
+try:
+    import orjson
+except ImportError:  # orjson未インストール環境では標準のjsonを使用
+    orjson = None
 
 from src.config import (
-    IS_LAMBDA, CORS_HEADERS, get_episodes_data_path,
-    get_episodes_list_path, get_metadata_path,
-    LOCAL_DATA_DIR, LOCAL_HOST, LOCAL_PORT, S3_BUCKET
+    IS_LAMBDA, CORS_HEADERS, LOG_LEVEL, get_env_number, get_episodes_data_path, get_s3_client,
+    get_episodes_list_path, get_metadata_path, build_audio_url,
+    LOCAL_DATA_DIR, LOCAL_AUDIO_URL_PREFIX, S3_BUCKET
 )
-from src.audio_proxy import lambda_handler as audio_proxy_handler
+from src.audio_proxy import lambda_handler as audio_proxy_handler, prime_s3_key_index
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# S3クライアント（Lambda環境でのみ初期化）
-s3_client = boto3.client('s3') if IS_LAMBDA else None
+logger.setLevel(LOG_LEVEL)
+
+# 署名付きURL生成（S3キー探索のhead_objectを含む）を並列実行するスレッドプール
+PRESIGN_MAX_WORKERS = 16
+_presign_pool = ThreadPoolExecutor(max_workers=PRESIGN_MAX_WORKERS)
+
+# S3オブジェクトの取得を並列実行するスレッドプール
+# （署名付きURL生成用のプールとは分け、取得処理内からの署名待ちで枯渇しないようにする）
+S3_FETCH_MAX_WORKERS = 16
+_s3_fetch_pool = ThreadPoolExecutor(max_workers=S3_FETCH_MAX_WORKERS)
+
+# 一括取得で一度に指定できるエピソード数の上限
+MAX_BULK_EPISODES = 20
+# エピソード一覧を返す前に、続けて開かれやすい先頭のエピソード詳細を先読みする件数
+EPISODE_PREFETCH_COUNT = 3
+# 先読みの完了を待つ上限（秒）。Lambdaはレスポンス後にコンテナを凍結するため、取得を残したまま返さない
+EPISODE_PREFETCH_TIMEOUT = 0.3
+
+# S3上のJSONオブジェクトのLRUキャッシュ（S3キー -> (ETag, パース結果, 確認時刻)）
+# 確認からS3_JSON_CACHE_TTL秒以内はS3への条件付きGETも省略する
+S3_JSON_CACHE_TTL = get_env_number('S3_JSON_CACHE_TTL', 30.0, convert=float)
+S3_JSON_CACHE_SIZE = 512
+_s3_json_cache = OrderedDict()
+_s3_json_cache_lock = threading.Lock()
+
+# S3バケットの音声URLからキーを抽出する正規表現
+# 仮想ホスト形式（グローバル・リージョン付き）とパス形式のいずれにも一致する
+_S3_URL_RE = re.compile(
+    r'https://(?:{bucket}\.s3(?:[.-][a-z0-9-]+)?\.amazonaws\.com/'
+    r'|s3(?:[.-][a-z0-9-]+)?\.amazonaws\.com/{bucket}/)'
+    r'([^?#]+)'.format(bucket=re.escape(S3_BUCKET)))
+
+# エピソードIDとして受け付ける形式（S3へ問い合わせる前に不正なIDを弾く）
+_EPISODE_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+# エピソード・記事の中で音声URLを保持するフィールド名
+_EPISODE_AUDIO_KEYS = ('intro_audio_url', 'outro_audio_url')
+_ARTICLE_AUDIO_KEYS = ('audio_url', 'english_audio_url')
+
+# 記事ID -> 所属エピソードIDの索引（エピソード詳細を取得するたびに記録）
+_article_episode_index = {}
+
+# エピソードID -> (エピソード詳細, 記事ID -> 記事) のLRU索引（上限はS3_JSON_CACHE_SIZE）
+# エピソード詳細がキャッシュから同じオブジェクトで返る間は作り直さない
+# 破棄したエピソードの記事は記事ID索引からも取り除く
+_episode_articles = OrderedDict()
+_episode_articles_lock = threading.Lock()
+
+# 直近にシリアライズしたエピソード一覧（(パース結果, JSON文字列, ETag)）
+# 一覧のパース結果はキャッシュから同じオブジェクトが返るため、同一なら再シリアライズしない
+_episodes_list_body = (None, None, None)
+
+# ブラウザ・CloudFrontにキャッシュを許可する秒数（一覧は更新が早いため短め）
+EPISODES_LIST_MAX_AGE = 30
+EPISODE_MAX_AGE = 300
+
+# ローカルJSONファイルのLRUキャッシュ（(パス, 変換関数) -> (ファイルシグネチャ, 読み込み結果)）
+LOCAL_JSON_CACHE_SIZE = 256
+_local_json_cache = OrderedDict()
+_local_json_cache_lock = threading.Lock()
 
 
 def build_response(status_code, body):
@@ -24,7 +91,7 @@ def build_response(status_code, body):
 
     Args:
         status_code: HTTPステータスコード
-        body: レスポンスボディ（dict）
+        body: レスポンスボディ（dict、またはシリアライズ済みのJSON文字列）
 
     Returns:
         dict: API Gatewayレスポンス形式
@@ -32,10 +99,471 @@ def build_response(status_code, body):
     return {
         'statusCode': status_code,
         'headers': CORS_HEADERS,
-        'body': json.dumps(body, ensure_ascii=False)
+        'body': body if isinstance(body, str) else _json_dumps(body)
     }
 
 
+def _get_header(event, header_name):
+    """リクエストヘッダーの値を大文字小文字を区別せずに取得
+
+    Args:
+        event: API Gatewayイベント
+        header_name: 小文字のヘッダー名
+
+    Returns:
+        str: ヘッダーの値（存在しない場合は空文字列）
+    """
+    for name, value in (event.get('headers') or {}).items():
+        if name.lower() == header_name:
+            return value or ''
+    return ''
+
+
+def _accepts_gzip(event):
+    """クライアントがgzip圧縮されたレスポンスを受け付けるか判定
+
+    Args:
+        event: API Gatewayイベント
+
+    Returns:
+        bool: Accept-Encodingにgzipが含まれる場合True
+    """
+    return 'gzip' in _get_header(event, 'accept-encoding')
+
+
+def _body_etag(body):
+    """レスポンスボディからETagを計算
+
+    Args:
+        body: JSON文字列
+
+    Returns:
+        str: 引用符で囲んだETag
+    """
+    return '"%s"' % hashlib.md5(body.encode('utf-8')).hexdigest()
+
+
+def _cacheable_response(event, response, max_age, compressed=False):
+    """成功レスポンスにCache-ControlとETagを付与し、If-None-Match一致時は304を返す
+
+    ETagはボディから計算するため、署名付きURLが再生成されると値も変わる。
+    レスポンスに計算済みのETagがあればそれを使う。
+
+    Args:
+        event: API Gatewayイベント
+        response: build_responseで構築したレスポンス
+        max_age: キャッシュを許可する秒数
+        compressed: gzip圧縮して返す場合True（非圧縮版と区別するため、ETagに-gzを付ける）
+
+    Returns:
+        dict: API Gatewayレスポンス
+    """
+    if response['statusCode'] != 200:
+        return response
+
+    etag = response['headers'].get('ETag') or _body_etag(response['body'])
+    if compressed:
+        etag = etag[:-1] + '-gz"'
+    headers = {
+        **response['headers'],
+        'Cache-Control': f'public, max-age={max_age}',
+        'ETag': etag
+    }
+    if_none_match = _get_header(event, 'if-none-match')
+    if if_none_match:
+        tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+        if etag in tags or '*' in tags:
+            return {'statusCode': 304, 'headers': headers, 'body': ''}
+    return {**response, 'headers': headers}
+
+
+def _gzip_response(response):
+    """API Gatewayレスポンスのボディをgzip圧縮する
+
+    バイナリとして返すため、ボディはBase64エンコードする。
+
+    Args:
+        response: build_responseで構築したレスポンス
+
+    Returns:
+        dict: 圧縮したボディを持つAPI Gatewayレスポンス
+    """
+    # CPU負荷の低い圧縮レベル1でも、JSONは十分に小さくなる
+    compressed = gzip.compress(response['body'].encode('utf-8'), compresslevel=1)
+    return {
+        'statusCode': response['statusCode'],
+        'headers': {
+            **response['headers'],
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
+            'Vary': 'Accept-Encoding'
+        },
+        'body': base64.b64encode(compressed).decode('ascii'),
+        'isBase64Encoded': True
+    }
+
+
+def _json_loads(data):
+    """JSONをパース
+
+    Args:
+        data: JSON文字列またはUTF-8のバイト列
+
+    Returns:
+        パース結果
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(body):
+    """JSON文字列にシリアライズ（非ASCII文字はエスケープしない）
+
+    Args:
+        body: シリアライズ対象
+
+    Returns:
+        str: JSON文字列
+    """
+    if orjson:
+        return orjson.dumps(body).decode('utf-8')
+    return json.dumps(body, ensure_ascii=False)
+
+
+# 内容が変わらないレスポンスボディはモジュール読み込み時に一度だけシリアライズする
+_EMPTY_BODY = _json_dumps({})
+_NOT_FOUND_BODY = _json_dumps({"error": "Not found"})
+_METHOD_NOT_ALLOWED_BODY = _json_dumps({"error": "Method not allowed"})
+_INTERNAL_ERROR_BODY = _json_dumps({"error": "Internal server error"})
+_EPISODES_LIST_NOT_FOUND_BODY = _json_dumps({"error": "Episodes list not found"})
+_EMPTY_PLAYLIST_BODY = _json_dumps({"playlist": []})
+_HEALTH_BODY = _json_dumps({"status": "OK", "service": "news-audio-api"})
+_INVALID_EPISODE_ID_BODY = _json_dumps({"error": "Invalid episode id"})
+
+# ルーティング段階で返す固定レスポンス（呼び出し側で変更してはならない）
+_OPTIONS_RESPONSE = build_response(200, _EMPTY_BODY)
+_METHOD_NOT_ALLOWED_RESPONSE = build_response(405, _METHOD_NOT_ALLOWED_BODY)
+_NOT_FOUND_RESPONSE = build_response(404, _NOT_FOUND_BODY)
+
+
+def _load_local_json(path, transform=None):
+    """ローカルのJSONファイルを読み込む
+
+    ファイルの更新時刻とサイズが変わらない限り、前回の読み込み結果を再利用する。
+    戻り値はキャッシュと共有されるため、呼び出し側で変更してはならない。
+
+    Args:
+        path: JSONファイルのパス
+        transform: 読み込み直後に一度だけ適用する変換関数（省略可）
+
+    Returns:
+        読み込み結果（transform指定時は変換後の値）
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = (path, transform)
+
+    with _local_json_cache_lock:
+        cached = _local_json_cache.get(cache_key)
+        if cached and cached[0] == signature:
+            _local_json_cache.move_to_end(cache_key)
+            return cached[1]
+
+    # バイナリで読み込み、デコードはパーサーに任せる
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    if transform:
+        data = transform(data)
+
+    with _local_json_cache_lock:
+        _local_json_cache[cache_key] = (signature, data)
+        _local_json_cache.move_to_end(cache_key)
+        # 上限を超えた場合は最も古く使われたエントリから破棄
+        while len(_local_json_cache) > LOCAL_JSON_CACHE_SIZE:
+            _local_json_cache.popitem(last=False)
+    return data
+
+
+def _get_s3_json(key):
+    """S3上のJSONオブジェクトを取得
+
+    前回の確認からS3_JSON_CACHE_TTL秒以内であればS3へ問い合わせずに前回のパース結果を返す。
+    それ以降は前回取得時のETagで条件付きGETを行い、変更がなければ前回のパース結果を返す。
+    戻り値はキャッシュと共有されるため、呼び出し側で変更してはならない。
+
+    Args:
+        key: S3キー
+
+    Returns:
+        パース結果
+
+    Raises:
+        ClientError: オブジェクトが取得できない場合
+    """
+    cached = _s3_json_cache.get(key)
+    now = time.monotonic()
+    if cached and now - cached[2] < S3_JSON_CACHE_TTL:
+        # 確認を省略した場合も利用順を更新し、よく使われるエントリを破棄しない
+        with _s3_json_cache_lock:
+            if key in _s3_json_cache:
+                _s3_json_cache.move_to_end(key)
+        return cached[1]
+
+    params = {'Bucket': S3_BUCKET, 'Key': key}
+    if cached:
+        params['IfNoneMatch'] = cached[0]
+
+    try:
+        response = get_s3_client().get_object(**params)
+    except ClientError as e:
+        # 変更がない場合は304 Not ModifiedがClientErrorとして返る
+        if cached and e.response['Error']['Code'] in ('304', 'NotModified'):
+            _store_s3_json(key, (cached[0], cached[1], now))
+            return cached[1]
+        raise
+
+    data = _json_loads(response['Body'].read())
+    _store_s3_json(key, (response['ETag'], data, now))
+    return data
+
+
+def _store_s3_json(key, entry):
+    """S3上のJSONオブジェクトのキャッシュを更新し、上限を超えた古いエントリを破棄
+
+    Args:
+        key: S3キー
+        entry: (ETag, パース結果, 確認時刻)
+    """
+    with _s3_json_cache_lock:
+        _s3_json_cache[key] = entry
+        _s3_json_cache.move_to_end(key)
+        while len(_s3_json_cache) > S3_JSON_CACHE_SIZE:
+            _s3_json_cache.popitem(last=False)
+
+
+def _wrap_episodes_list(data):
+    """エピソード一覧を{"episodes": []}形式に統一
+
+    Args:
+        data: エピソード一覧ファイルの内容
+
+    Returns:
+        dict: {"episodes": [...]}形式のエピソード一覧
+    """
+    # episodes_list.jsonの場合は配列形式、episodes.jsonは{"episodes": []}形式
+    if isinstance(data, list):
+        return {"episodes": data}
+    return data
+
+
+def _to_local_audio_url(url):
+    """S3の音声URLをローカルサーバーのURLに置き換える
+
+    Args:
+        url: 音声URL
+
+    Returns:
+        str: ローカル用URL（https://で始まらない場合はそのまま）
+    """
+    if url and url.startswith('https://'):
+        # S3 URLからファイル名を抽出
+        return LOCAL_AUDIO_URL_PREFIX + url.rpartition('/')[2]
+    return url
+
+
+def _localize_episode_urls(episode):
+    """エピソード内のS3のURLをローカル環境用に置き換える
+
+    Args:
+        episode: エピソード詳細
+
+    Returns:
+        dict: URL置き換え後のエピソード詳細
+    """
+    for article in episode.get('articles', []):
+        for key in _ARTICLE_AUDIO_KEYS:
+            if article.get(key):
+                article[key] = _to_local_audio_url(article[key])
+
+    # ナレーション音声URLの置き換え
+    for key in _EPISODE_AUDIO_KEYS:
+        if episode.get(key):
+            episode[key] = _to_local_audio_url(episode[key])
+
+    return episode
+
+
+def _s3_key_from_url(url):
+    """S3バケットの音声URLからS3キーを抽出
+
+    Args:
+        url: 音声URL
+
+    Returns:
+        str: S3キー（このバケットのS3 URLでない場合はNone）
+    """
+    match = _S3_URL_RE.match(url)
+    return match.group(1) if match else None
+
+
+def _is_presigned_url(url):
+    """署名付きURLかどうかを判定
+
+    Args:
+        url: 音声URL
+
+    Returns:
+        bool: 署名付きURLの場合True
+    """
+    return isinstance(url, str) and 'X-Amz-Signature=' in url
+
+
+def _rewrite_s3_url(url):
+    """S3バケットの音声URLを署名付きURLまたはAPI Gateway経由のURLに変換
+
+    署名済みのURLや、このバケット以外のURLはそのまま返す。
+
+    Args:
+        url: 音声URL
+
+    Returns:
+        str: 変換後のURL
+    """
+    if _is_presigned_url(url):
+        return url
+
+    audio_key = _s3_key_from_url(url)
+    if not audio_key:
+        return url
+
+    return build_audio_url(audio_key)
+
+
+def _playlist_audio_key(url):
+    """プレイリストのaudio_urlから音声ファイルのキーを抽出
+
+    Args:
+        url: プレイリスト項目のaudio_url
+
+    Returns:
+        str: 音声ファイルのキーまたはファイル名
+    """
+    if url.startswith('/audio/'):
+        audio_key = url.removeprefix('/audio/')
+        # URLスキームが含まれている異常パターン（/audio/https://...）はファイル名のみ使用
+        if audio_key.startswith(('http://', 'https://')):
+            return audio_key.rsplit('/', 1)[-1]
+        return audio_key
+
+    if url.startswith(('https://', 'http://')):
+        # このバケットのS3 URLはキーを、その他のURLはファイル名を使用
+        return _s3_key_from_url(url) or url.rsplit('/', 1)[-1]
+
+    # その他の形式（単純なファイル名など）
+    return url
+
+
+def _localize_playlist(metadata):
+    """プレイリストの音声URLをローカルサーバーのURLに置き換える
+
+    Args:
+        metadata: エピソードのメタデータ
+
+    Returns:
+        dict: 音声URLを置き換えたメタデータ
+    """
+    for item in metadata.get('playlist', []):
+        audio_url = item.get('audio_url')
+        if not audio_url:
+            continue
+
+        # 既に/audio/が付いている場合
+        if audio_url.startswith('/audio/'):
+            # "/audio/"の後の部分
+            after_prefix = audio_url.removeprefix('/audio/')
+
+            if after_prefix.startswith('http'):
+                # URLスキームが含まれている場合はファイル名のみ抽出
+                item['audio_url'] = LOCAL_AUDIO_URL_PREFIX + after_prefix.rpartition('/')[2]
+            else:
+                # 通常の相対パスの場合は既に適切
+                item['audio_url'] = LOCAL_AUDIO_URL_PREFIX + after_prefix
+        elif audio_url.startswith(('https://', 'http://')):
+            # 完全なURLの場合、ファイル名のみを抽出
+            item['audio_url'] = LOCAL_AUDIO_URL_PREFIX + audio_url.rpartition('/')[2]
+        else:
+            # その他の形式（単純なファイル名など）
+            item['audio_url'] = LOCAL_AUDIO_URL_PREFIX + audio_url
+    return metadata
+
+
+def _collect_presign_targets(episode):
+    """エピソード内で署名付きURLに変換すべきS3の音声URLを収集
+
+    Args:
+        episode: エピソード詳細
+
+    Returns:
+        list: (URLを保持するdict, フィールド名, S3キー)のリスト
+    """
+    # イントロ・アウトロ音声と、各記事の日本語・英語音声
+    containers = [(episode, _EPISODE_AUDIO_KEYS)]
+    containers.extend((article, _ARTICLE_AUDIO_KEYS)
+                      for article in episode.get('articles', []))
+
+    targets = []
+    for container, fields in containers:
+        for field in fields:
+            original_url = container.get(field)
+            if not original_url or not isinstance(original_url, str):
+                continue
+
+            # 既に署名付きURLの場合はスキップ
+            if _is_presigned_url(original_url):
+                continue
+
+            # S3 URLからキーを抽出
+            audio_key = _s3_key_from_url(original_url)
+            if audio_key:
+                targets.append((container, field, audio_key))
+    return targets
+
+
+def _apply_presigned_urls(targets):
+    """収集した音声URLを並列に署名付きURLまたはAPI Gateway経由のURLへ変換
+
+    Args:
+        targets: _collect_presign_targetsの戻り値
+    """
+    audio_keys = [audio_key for _, _, audio_key in targets]
+    urls = _presign_pool.map(build_audio_url, audio_keys)
+    for (container, field, _), url in zip(targets, urls):
+        container[field] = url
+
+
+def _serialize_episodes_list(episodes):
+    """エピソード一覧をシリアライズ（前回と同じオブジェクトなら結果を再利用）
+
+    Args:
+        episodes: エピソード一覧のパース結果
+
+    Returns:
+        tuple: (JSON文字列, ETag)
+    """
+    global _episodes_list_body
+
+    cached_episodes, body, etag = _episodes_list_body
+    if cached_episodes is not episodes:
+        body = _json_dumps(episodes)
+        etag = _body_etag(body)
+        _episodes_list_body = (episodes, body, etag)
+    return body, etag
+
+
 def get_episodes():
     """全エピソード一覧を取得
 
@@ -48,34 +576,169 @@ def get_episodes():
         if IS_LAMBDA:
             # AWS環境: S3からデータ取得
             try:
-                response = s3_client.get_object(
-                    Bucket=S3_BUCKET, Key=episodes_path)
-                episodes = json.loads(response['Body'].read().decode('utf-8'))
+                episodes = _get_s3_json(episodes_path)
             except ClientError as e:
-                logger.error(f"S3からのエピソード一覧取得エラー: {str(e)}")
-                return build_response(404, {"error": "Episodes list not found"})
+                logger.error("S3からのエピソード一覧取得エラー: %s", e)
+                return build_response(404, _EPISODES_LIST_NOT_FOUND_BODY)
+            _prefetch_episodes(episodes)
         else:
             # ローカル環境: ファイルシステムからデータ取得
             try:
-                with open(episodes_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # episodes_list.jsonの場合は配列形式、episodes.jsonは{"episodes": []}形式
-                if isinstance(data, list):
-                    episodes = {"episodes": data}
-                else:
-                    episodes = data
+                episodes = _load_local_json(episodes_path, _wrap_episodes_list)
             except FileNotFoundError:
-                logger.error(f"エピソード一覧ファイルが見つかりません: {episodes_path}")
+                logger.error("エピソード一覧ファイルが見つかりません: %s", episodes_path)
                 # ファイルが見つからない場合は空のリストを返す
                 episodes = {"episodes": []}
 
-        return build_response(200, episodes)
+        body, etag = _serialize_episodes_list(episodes)
+        response = build_response(200, body)
+        # シリアライズ結果と一緒に保持したETagを使い、リクエストごとのハッシュ計算を省く
+        response['headers'] = {**response['headers'], 'ETag': etag}
+        return response
 
     except Exception as e:
-        logger.error(f"エピソード一覧取得エラー: {str(e)}")
-        logger.error(traceback.format_exc())
-        return build_response(500, {"error": "Internal server error"})
+        logger.exception("エピソード一覧取得エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
+
+
+def _fetch_episode_detail(episode_id):
+    """S3からエピソード詳細を取得し、記事ID索引に記録
+
+    S3上のJSONキャッシュを経由するため、戻り値を変更してはならない。
+
+    Args:
+        episode_id: エピソードID
+
+    Returns:
+        dict: エピソード詳細（音声URLは変換前のまま）
+
+    Raises:
+        ClientError: S3からエピソードが取得できない場合
+    """
+    return _fetch_episode_articles(episode_id)[0]
+
+
+def _fetch_episode_articles(episode_id):
+    """S3からエピソード詳細と、その記事のID索引を取得
+
+    索引はエピソード詳細が更新された場合のみ作り直し、記事ID索引にも記録する。
+
+    Args:
+        episode_id: エピソードID
+
+    Returns:
+        tuple: (エピソード詳細, 記事ID -> 記事の辞書)
+
+    Raises:
+        ClientError: S3からエピソードが取得できない場合
+    """
+    episode_detail = _get_s3_json(get_episodes_data_path(episode_id))
+
+    with _episode_articles_lock:
+        cached = _episode_articles.get(episode_id)
+        if cached and cached[0] is episode_detail:
+            _episode_articles.move_to_end(episode_id)
+            return cached
+
+    articles_by_id = {}
+    for article in episode_detail.get('articles', []):
+        if article.get('id'):
+            # IDが重複する場合は先頭の記事を優先する
+            articles_by_id.setdefault(article['id'], article)
+
+    with _episode_articles_lock:
+        previous = _episode_articles.get(episode_id)
+        if previous:
+            # 更新で削除された記事を記事ID索引から取り除く
+            _drop_article_index(episode_id, previous[1].keys() - articles_by_id.keys())
+        for article_id in articles_by_id:
+            # 複数のエピソードにある記事IDは、記録済みの所属エピソード（一覧順の検索結果など）を上書きしない
+            _article_episode_index.setdefault(article_id, episode_id)
+
+        cached = (episode_detail, articles_by_id)
+        _episode_articles[episode_id] = cached
+        _episode_articles.move_to_end(episode_id)
+        while len(_episode_articles) > S3_JSON_CACHE_SIZE:
+            evicted_id, (_, evicted_articles) = _episode_articles.popitem(last=False)
+            _drop_article_index(evicted_id, evicted_articles)
+    return cached
+
+
+def _drop_article_index(episode_id, article_ids):
+    """記事ID索引から、指定エピソードを指している記事を取り除く
+
+    _episode_articles_lockを保持した状態で呼び出す。
+
+    Args:
+        episode_id: エピソードID
+        article_ids: 取り除く記事IDのイテラブル
+    """
+    for article_id in article_ids:
+        if _article_episode_index.get(article_id) == episode_id:
+            _article_episode_index.pop(article_id, None)
+
+
+def _prefetch_episode(episode_id):
+    """エピソード詳細をS3上のJSONキャッシュに読み込む（失敗しても無視する）
+
+    Args:
+        episode_id: エピソードID
+    """
+    try:
+        _fetch_episode_detail(episode_id)
+    except Exception as e:
+        logger.debug("エピソード %s の先読みに失敗: %s", episode_id, e)
+
+
+def _prefetch_episodes(episodes_data):
+    """一覧の先頭のエピソード詳細を並列に先読みする
+
+    EPISODE_PREFETCH_TIMEOUT秒まで完了を待ち、それまでに始まっていない先読みは取り消す。
+
+    Args:
+        episodes_data: エピソード一覧（配列または{"episodes": []}形式）
+    """
+    episodes = _wrap_episodes_list(episodes_data).get('episodes', [])
+    futures = [
+        _s3_fetch_pool.submit(_prefetch_episode, episode['episode_id'])
+        for episode in episodes[:EPISODE_PREFETCH_COUNT] if episode.get('episode_id')]
+    _, not_done = wait(futures, timeout=EPISODE_PREFETCH_TIMEOUT)
+    for future in not_done:
+        future.cancel()
+
+
+def _load_episode(episode_id):
+    """エピソード詳細を取得し、音声URLを環境に合わせて変換
+
+    Args:
+        episode_id: エピソードID
+
+    Returns:
+        dict: エピソード詳細
+
+    Raises:
+        ClientError: S3からエピソードが取得できない場合（AWS環境）
+        FileNotFoundError: エピソードファイルが存在しない場合（ローカル環境）
+    """
+    if IS_LAMBDA:
+        # AWS環境: S3からデータ取得（キャッシュと共有しないよう、URL変換前に書き換える階層だけ複製する）
+        detail = _fetch_episode_detail(episode_id)
+        episode = dict(detail)
+        if 'articles' in detail:
+            episode['articles'] = [dict(article) for article in detail['articles']]
+
+        # S3バケットURLを署名付きURLまたはAPI Gateway経由のURLに変換
+        logger.info("エピソード音声URL変換処理を開始")
+        targets = _collect_presign_targets(episode)
+        # 並列に署名する前に、エピソードの音声キーをまとめて一覧取得してHEADリクエストを省く
+        prime_s3_key_index([audio_key for _, _, audio_key in targets])
+        _apply_presigned_urls(targets)
+        logger.info("エピソード音声URL変換処理を完了: %d件", len(targets))
+        return episode
+
+    # ローカル環境: S3のURLをローカル環境用に置き換えた結果をキャッシュする
+    return _load_local_json(
+        get_episodes_data_path(episode_id), _localize_episode_urls)
 
 
 def get_episode(episode_id):
@@ -88,125 +751,117 @@ def get_episode(episode_id):
         dict: APIレスポンス
     """
     try:
-        episodes_data_path = get_episodes_data_path(episode_id)
+        try:
+            episode = _load_episode(episode_id)
+        except ClientError as e:
+            logger.error("S3からのエピソード取得エラー: %s", e)
+            return build_response(404, {"error": f"Episode {episode_id} not found"})
+        except FileNotFoundError:
+            logger.error("エピソードファイルが見つかりません: %s", episode_id)
+            return build_response(404, {"error": f"Episode {episode_id} not found"})
 
-        if IS_LAMBDA:
-            # AWS環境: S3からデータ取得
-            try:
-                response = s3_client.get_object(
-                    Bucket=S3_BUCKET, Key=episodes_data_path)
-                episode = json.loads(response['Body'].read().decode('utf-8'))
-
-                # S3バケットURLを署名付きURLまたはAPI Gateway経由のURLに変換
-                # 記事の音声URL変換
-                from src.config import build_audio_url
-                logger.info("エピソード音声URL変換処理を開始")
-                
-                # 記事の音声URL変換
-                for article in episode.get('articles', []):
-                    # 通常の音声URL変換
-                    if 'audio_url' in article and article['audio_url']:
-                        original_url = article['audio_url']
-                        
-                        # 既に署名付きURLの場合はスキップ
-                        if isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url:
-                            logger.info(f"既に署名付きURLが設定されています: {original_url}")
-                            continue
-                            
-                        # S3 URLからキーを抽出
-                        if isinstance(original_url, str) and original_url.startswith('https://') and f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                            audio_key = original_url.split(f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                            logger.info(f"S3 URLからキー抽出: {audio_key}")
-                            
-                            # 署名付きURLまたはAPI Gateway経由のURLを生成
-                            article['audio_url'] = build_audio_url(audio_key)
-                            logger.info(f"音声URL変換結果: {article['audio_url']}")
-
-                    # 英語音声のURL変換
-                    if 'english_audio_url' in article and article['english_audio_url']:
-                        original_url = article['english_audio_url']
-                        
-                        # 既に署名付きURLの場合はスキップ
-                        if isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url:
-                            logger.info(f"既に署名付きURLが設定されています（英語）: {original_url}")
-                            continue
-                            
-                        # S3 URLからキーを抽出
-                        if isinstance(original_url, str) and original_url.startswith('https://') and f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                            audio_key = original_url.split(f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                            logger.info(f"S3 URLからキー抽出（英語）: {audio_key}")
-                            
-                            # 署名付きURLまたはAPI Gateway経由のURLを生成
-                            article['english_audio_url'] = build_audio_url(audio_key)
-                            logger.info(f"英語音声URL変換結果: {article['english_audio_url']}")
-
-                # イントロ音声のURL変換
-                if 'intro_audio_url' in episode and episode['intro_audio_url']:
-                    original_url = episode['intro_audio_url']
-                    
-                    # 既に署名付きURLの場合はスキップ
-                    if not (isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url):
-                        # S3 URLからキーを抽出
-                        if isinstance(original_url, str) and original_url.startswith('https://') and f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                            audio_key = original_url.split(f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                            logger.info(f"S3 URLからキー抽出（イントロ）: {audio_key}")
-                            
-                            # 署名付きURLまたはAPI Gateway経由のURLを生成
-                            episode['intro_audio_url'] = build_audio_url(audio_key)
-                            logger.info(f"イントロURL変換結果: {episode['intro_audio_url']}")
-
-                # アウトロ音声のURL変換
-                if 'outro_audio_url' in episode and episode['outro_audio_url']:
-                    original_url = episode['outro_audio_url']
-                    
-                    # 既に署名付きURLの場合はスキップ
-                    if not (isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url):
-                        # S3 URLからキーを抽出
-                        if isinstance(original_url, str) and original_url.startswith('https://') and f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                            audio_key = original_url.split(f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                            logger.info(f"S3 URLからキー抽出（アウトロ）: {audio_key}")
-                            
-                            # 署名付きURLまたはAPI Gateway経由のURLを生成
-                            episode['outro_audio_url'] = build_audio_url(audio_key)
-                            logger.info(f"アウトロURL変換結果: {episode['outro_audio_url']}")
-                
-                logger.info("エピソード音声URL変換処理を完了")
+        return build_response(200, episode)
 
-            except ClientError as e:
-                logger.error(f"S3からのエピソード取得エラー: {str(e)}")
-                return build_response(404, {"error": f"Episode {episode_id} not found"})
-        else:
-            # ローカル環境: ファイルシステムからデータ取得
-            try:
-                with open(episodes_data_path, 'r', encoding='utf-8') as f:
-                    episode = json.load(f)
+    except Exception as e:
+        logger.exception("エピソード取得エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
 
-                # S3のURLをローカル環境用に置き換える
-                for article in episode.get('articles', []):
-                    if 'audio_url' in article and article['audio_url'] and article['audio_url'].startswith('https://'):
-                        # S3 URLからファイル名を抽出
-                        filename = article['audio_url'].split('/')[-1]
-                        article['audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
 
-                # ナレーション音声URLの置き換え
-                if 'intro_audio_url' in episode and episode['intro_audio_url'] and episode['intro_audio_url'].startswith('https://'):
-                    filename = episode['intro_audio_url'].split('/')[-1]
-                    episode['intro_audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
+def get_episodes_bulk(episode_ids):
+    """複数エピソードの詳細をまとめて取得
 
-                if 'outro_audio_url' in episode and episode['outro_audio_url'] and episode['outro_audio_url'].startswith('https://'):
-                    filename = episode['outro_audio_url'].split('/')[-1]
-                    episode['outro_audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
+    各エピソードの取得は並列に行い、S3へのリクエストの待ち時間を重ねる。
 
-            except FileNotFoundError:
-                logger.error(f"エピソードファイルが見つかりません: {episodes_data_path}")
-                return build_response(404, {"error": f"Episode {episode_id} not found"})
+    Args:
+        episode_ids: エピソードIDのリスト
 
-        return build_response(200, episode)
+    Returns:
+        dict: APIレスポンス（見つからなかったIDはnot_foundに列挙）
+    """
+    try:
+        if len(episode_ids) > MAX_BULK_EPISODES:
+            return build_response(400, {"error": f"Too many episode ids (max {MAX_BULK_EPISODES})"})
+
+        def load(episode_id):
+            try:
+                return _load_episode(episode_id)
+            except (ClientError, FileNotFoundError):
+                return None
+
+        episodes = []
+        not_found = []
+        for episode_id, episode in zip(episode_ids, _s3_fetch_pool.map(load, episode_ids)):
+            if episode is None:
+                not_found.append(episode_id)
+            else:
+                episodes.append(episode)
+
+        return build_response(200, {"episodes": episodes, "not_found": not_found})
 
     except Exception as e:
-        logger.error(f"エピソード取得エラー: {str(e)}")
-        logger.error(traceback.format_exc())
-        return build_response(500, {"error": "Internal server error"})
+        logger.exception("エピソード一括取得エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
+
+
+def _find_article(article_id):
+    """S3上のエピソードから記事を探す
+
+    記事ID索引に所属エピソードが記録されていればそのエピソードだけを取得し、
+    なければエピソード一覧の各エピソードを並列に検索する。
+
+    Args:
+        article_id: 記事ID
+
+    Returns:
+        dict: 記事（見つからない場合はNone）
+
+    Raises:
+        ClientError: S3からエピソード一覧が取得できない場合
+    """
+    indexed_episode_id = _article_episode_index.get(article_id)
+    if indexed_episode_id:
+        try:
+            article = _fetch_episode_articles(indexed_episode_id)[1].get(article_id)
+            if article:
+                return article
+        except ClientError:
+            # エピソードが削除された場合などは一覧からの検索にフォールバック
+            pass
+        _article_episode_index.pop(article_id, None)
+
+    episodes_data = _get_s3_json(get_episodes_list_path())
+
+    # episodes形式に統一
+    if isinstance(episodes_data, list):
+        episodes = episodes_data
+    else:
+        episodes = episodes_data.get('episodes', [])
+
+    def search(episode_id):
+        try:
+            return _fetch_episode_articles(episode_id)[1].get(article_id)
+        except ClientError:
+            # エピソード詳細が取得できなければスキップ
+            return None
+
+    # 各エピソードを並列に取得し、一覧の順に結果を確認する（複数のエピソードにある記事IDは先頭側を返す）
+    # 見つかった時点で未開始の取得を取り消す
+    episode_ids = [episode.get('episode_id') for episode in episodes
+                   if episode.get('episode_id') and episode.get('episode_id') != indexed_episode_id]
+    futures = [_s3_fetch_pool.submit(search, episode_id) for episode_id in episode_ids]
+    try:
+        for episode_id, future in zip(episode_ids, futures):
+            article = future.result()
+            if article:
+                with _episode_articles_lock:
+                    # 破棄済みのエピソードは索引に記録しない
+                    if episode_id in _episode_articles:
+                        _article_episode_index[article_id] = episode_id
+                return article
+    finally:
+        for future in futures:
+            future.cancel()
+    return None
 
 
 def get_article_audio(article_id, language='ja'):
@@ -220,101 +875,33 @@ def get_article_audio(article_id, language='ja'):
         dict: APIレスポンス
     """
     try:
-        # 全エピソードファイルから記事IDに対応する音声ファイルを探す
         if IS_LAMBDA:
-            # S3からエピソードリストを取得
             try:
-                episodes_path = get_episodes_list_path()
-                response = s3_client.get_object(
-                    Bucket=S3_BUCKET, Key=episodes_path)
-                episodes_data = json.loads(
-                    response['Body'].read().decode('utf-8'))
-
-                # episodes形式に統一
-                if isinstance(episodes_data, list):
-                    episodes = episodes_data
+                article = _find_article(article_id)
+            except ClientError as e:
+                logger.error("S3からのエピソード一覧取得エラー: %s", e)
+                return build_response(404, _EPISODES_LIST_NOT_FOUND_BODY)
+
+            if article:
+                # 言語に応じた音声ファイルURLを返す
+                if language == 'en' and article.get('english_audio_url'):
+                    original_url = article['english_audio_url']
                 else:
-                    episodes = episodes_data.get('episodes', [])
-
-                # 各エピソードを検索
-                for episode in episodes:
-                    episode_id = episode.get('episode_id')
-                    if not episode_id:
-                        continue
-
-                    # エピソード詳細を取得
-                    try:
-                        episodes_data_path = get_episodes_data_path(episode_id)
-                        response = s3_client.get_object(
-                            Bucket=S3_BUCKET, Key=episodes_data_path)
-                        episode_detail = json.loads(
-                            response['Body'].read().decode('utf-8'))
-
-                        # 記事を検索
-                        for article in episode_detail.get('articles', []):
-                            if article.get('id') == article_id:
-                                # 言語に応じた音声ファイルURLを返す
-                                from src.config import build_audio_url
-
-                                if language == 'en' and article.get('english_audio_url'):
-                                    original_url = article['english_audio_url']
-                                    
-                                    # 既に署名付きURLの場合はそのまま返す
-                                    if isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url:
-                                        logger.info(f"既に署名付きURLが設定されています（英語）: {original_url}")
-                                        return build_response(200, {"url": original_url})
-                                    
-                                    # S3バケットのURLを署名付きURLに変換
-                                    if original_url and original_url.startswith('https://'):
-                                        if f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                                            # S3 URLからキーを抽出
-                                            audio_key = original_url.split(
-                                                f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                                            api_url = build_audio_url(
-                                                audio_key)
-                                            return build_response(200, {"url": api_url})
-                                        else:
-                                            # 既にAPI Gateway URL等の場合はそのまま返す
-                                            return build_response(200, {"url": original_url})
-
-                                elif article.get('audio_url'):
-                                    original_url = article['audio_url']
-                                    
-                                    # 既に署名付きURLの場合はそのまま返す
-                                    if isinstance(original_url, str) and original_url.startswith(('https://', 'http://')) and 'X-Amz-Signature=' in original_url:
-                                        logger.info(f"既に署名付きURLが設定されています: {original_url}")
-                                        return build_response(200, {"url": original_url})
-                                    
-                                    # S3バケットのURLを署名付きURLに変換
-                                    if original_url and original_url.startswith('https://'):
-                                        if f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                                            # S3 URLからキーを抽出
-                                            audio_key = original_url.split(
-                                                f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                                            api_url = build_audio_url(
-                                                audio_key)
-                                            return build_response(200, {"url": api_url})
-                                        else:
-                                            # 既にAPI Gateway URL等の場合はそのまま返す
-                                            return build_response(200, {"url": original_url})
-                    except ClientError:
-                        # エピソード詳細が取得できなければスキップ
-                        continue
-
-                # 音声ファイルが見つからない場合
-                return build_response(404, {"error": f"Audio file for article {article_id} not found"})
+                    original_url = article.get('audio_url')
 
-            except ClientError as e:
-                logger.error(f"S3からのエピソード一覧取得エラー: {str(e)}")
-                return build_response(404, {"error": "Episodes list not found"})
+                # S3バケットのURLは署名付きURLに変換し、それ以外の完全なURLはそのまま返す
+                if isinstance(original_url, str) and original_url.startswith(('https://', 'http://')):
+                    return build_response(200, {"url": _rewrite_s3_url(original_url)})
+
+            # 音声ファイルが見つからない場合
+            return build_response(404, {"error": f"Audio file for article {article_id} not found"})
         else:
             # ローカル環境では、S3へのアクセスなしでエミュレーション
-            return build_response(200, {"url": f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{article_id}.mp3"})
+            return build_response(200, {"url": f"{LOCAL_AUDIO_URL_PREFIX}{article_id}.mp3"})
 
     except Exception as e:
-        logger.error(f"記事音声取得エラー: {str(e)}")
-        logger.error(traceback.format_exc())
-        return build_response(500, {"error": "Internal server error"})
+        logger.exception("記事音声取得エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
 
 
 def get_playlist(episode_id):
@@ -332,115 +919,33 @@ def get_playlist(episode_id):
         # メタデータファイルの取得を試みる
         try:
             if IS_LAMBDA:
-                metadata_path = get_metadata_path(episode_id)
-                metadata_response = s3_client.get_object(
-                    Bucket=S3_BUCKET, Key=metadata_path)
-                metadata = json.loads(
-                    metadata_response['Body'].read().decode('utf-8'))
+                metadata = _get_s3_json(get_metadata_path(episode_id))
 
                 # S3バケットURLをAPI Gateway経由のURLまたは署名付きURLに変換
                 if 'playlist' in metadata:
-                    from src.config import build_audio_url
+                    # キャッシュと共有しないよう、URL変換前にプレイリストを複製する
+                    metadata = {'playlist': [dict(item) for item in metadata['playlist']]}
+                    targets = []
                     for item in metadata['playlist']:
-                        if 'audio_url' in item and item['audio_url']:
-                            original_url = item['audio_url']
-                            
-                            # デバッグ出力
-                            logger.info(f"元のaudio_url: {original_url}")
-
-                            # 処理対象URLがすでに署名付きURLの場合はスキップ
-                            if isinstance(original_url, str) and (
-                                (original_url.startswith('https://') and 'X-Amz-Signature=' in original_url) or
-                                (original_url.startswith('http://') and 'X-Amz-Signature=' in original_url)
-                            ):
-                                logger.info(f"  既に署名付きURLが設定されています: {original_url}")
-                                continue
-                            
-                            # URLパスから正しいファイルパスまたはキーを抽出
-                            audio_key = None
-                            
-                            if original_url.startswith('/audio/'):
-                                # /audio/プレフィックスがある場合
-                                audio_key = original_url[7:]  # "/audio/"の後の部分
-                                logger.info(f"  /audio/プレフィックス後: {audio_key}")
-                                
-                                # URLスキームが含まれている異常パターン: /audio/https://...
-                                if audio_key.startswith(('http://', 'https://')):
-                                    audio_key = audio_key.split('/')[-1]  # ファイル名のみ抽出
-                                    logger.info(f"  異常パターン検出 - ファイル名抽出: {audio_key}")
-                            
-                            elif original_url.startswith(('https://', 'http://')):
-                                # 完全なURLの場合
-                                logger.info(f"  完全なURLを検出: {original_url}")
-                                
-                                if f"{S3_BUCKET}.s3.amazonaws.com/" in original_url:
-                                    # S3 URL
-                                    audio_key = original_url.split(f"{S3_BUCKET}.s3.amazonaws.com/")[-1]
-                                    logger.info(f"  S3 URL処理 - キー抽出: {audio_key}")
-                                else:
-                                    # その他のURL
-                                    audio_key = original_url.split('/')[-1]  # ファイル名のみ抽出
-                                    logger.info(f"  その他のURL処理 - ファイル名抽出: {audio_key}")
-                            
-                            else:
-                                # その他の形式（単純なファイル名など）
-                                audio_key = original_url
-                                logger.info(f"  シンプルなパス処理: {audio_key}")
-                            
-                            # 署名付きURLまたはAPI Gateway経由のURLを生成
-                            item['audio_url'] = build_audio_url(audio_key)
-                            
-                            # 変換結果を記録
-                            logger.info(f"変換後のaudio_url: {item['audio_url']}")
-                            
-                            # 署名付きURLの生成に失敗した場合の最終チェック
-                            if item['audio_url'] and '/audio/http' in item['audio_url']:
-                                # 異常な形式が残っている場合は修正
-                                logger.info(f"  最終チェックで異常を検出: {item['audio_url']}")
-                                parts = item['audio_url'].split('/audio/')
-                                if len(parts) > 1 and parts[1].startswith(('http://', 'https://')):
-                                    filename = parts[1].split('/')[-1]
-                                    item['audio_url'] = build_audio_url(filename)
-                                    logger.info(f"  最終修正を適用: {item['audio_url']}")
+                        original_url = item.get('audio_url')
+                        # 処理対象URLがすでに署名付きURLの場合はスキップ
+                        if not original_url or _is_presigned_url(original_url):
+                            continue
+                        targets.append(
+                            (item, 'audio_url', _playlist_audio_key(original_url)))
+                    _apply_presigned_urls(targets)
 
             else:
-                metadata_path = get_metadata_path(episode_id)
-                if os.path.exists(metadata_path):
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-
-                    # ローカル環境でもS3 URLを変換
-                    if 'playlist' in metadata:
-                        for item in metadata['playlist']:
-                            if 'audio_url' in item and item['audio_url']:
-                                audio_url = item['audio_url']
-
-                                # 既に/audio/が付いている場合
-                                if audio_url.startswith('/audio/'):
-                                    # "/audio/"の後の部分
-                                    after_prefix = audio_url[7:]
-
-                                    if after_prefix.startswith('http'):
-                                        # URLスキームが含まれている場合はファイル名のみ抽出
-                                        filename = after_prefix.split('/')[-1]
-                                        item['audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
-                                    else:
-                                        # 通常の相対パスの場合は既に適切
-                                        item['audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{after_prefix}"
-                                elif audio_url.startswith('https://') or audio_url.startswith('http://'):
-                                    # 完全なURLの場合、ファイル名のみを抽出
-                                    filename = audio_url.split('/')[-1]
-                                    item['audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
-                                else:
-                                    # その他の形式（単純なファイル名など）
-                                    item['audio_url'] = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{audio_url}"
+                # ローカル環境: S3のURLをローカル環境用に置き換えた結果をキャッシュする
+                metadata = _load_local_json(
+                    get_metadata_path(episode_id), _localize_playlist)
 
         except (ClientError, FileNotFoundError):
             # メタデータファイルが存在しない場合はエラーを返す
-            logger.info(f"メタデータファイルが見つかりません: {episode_id}")
+            logger.info("メタデータファイルが見つかりません: %s", episode_id)
             return build_response(404, {"error": f"Metadata for episode {episode_id} not found"})
         except Exception as e:
-            logger.error(f"メタデータ取得エラー: {str(e)}")
+            logger.error("メタデータ取得エラー: %s", e)
             return build_response(500, {"error": "Failed to get metadata"})
 
         # メタデータからプレイリストを直接取得
@@ -448,12 +953,11 @@ def get_playlist(episode_id):
             return build_response(200, {"playlist": metadata['playlist']})
         else:
             # プレイリストがない場合は空のリストを返す
-            return build_response(200, {"playlist": []})
+            return build_response(200, _EMPTY_PLAYLIST_BODY)
 
     except Exception as e:
-        logger.error(f"プレイリスト取得エラー: {str(e)}")
-        logger.error(traceback.format_exc())
-        return build_response(500, {"error": "Internal server error"})
+        logger.exception("プレイリスト取得エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
 
 
 def get_health():
@@ -462,7 +966,68 @@ def get_health():
     Returns:
         dict: APIレスポンス
     """
-    return build_response(200, {"status": "OK", "service": "news-audio-api"})
+    return build_response(200, _HEALTH_BODY)
+
+
+def _route_episodes(event):
+    """エピソード一覧（?ids=a,b,c 指定時は複数エピソードの詳細）を返す"""
+    query_params = event.get('queryStringParameters') or {}
+    if query_params.get('ids'):
+        episode_ids = [
+            episode_id for episode_id in dict.fromkeys(query_params['ids'].split(','))
+            if episode_id]
+        if not all(_EPISODE_ID_RE.fullmatch(episode_id) for episode_id in episode_ids):
+            return build_response(400, _INVALID_EPISODE_ID_BODY)
+        response = get_episodes_bulk(episode_ids)
+    else:
+        response = get_episodes()
+    use_gzip = _accepts_gzip(event)
+    response = _cacheable_response(
+        event, response, EPISODES_LIST_MAX_AGE, compressed=use_gzip)
+
+    # 一覧はエピソード数に比例して大きくなるため、対応クライアントにはgzipで返す
+    if response['statusCode'] == 200 and use_gzip:
+        return _gzip_response(response)
+    # Accept-Encodingで内容が変わるため、304やエラーを含むすべてのレスポンスにVaryを付ける
+    return {**response, 'headers': {**response['headers'], 'Vary': 'Accept-Encoding'}}
+
+
+def _route_episode(event, episode_id):
+    """エピソード詳細を返す"""
+    if not _EPISODE_ID_RE.fullmatch(episode_id):
+        return build_response(400, _INVALID_EPISODE_ID_BODY)
+    return _cacheable_response(event, get_episode(episode_id), EPISODE_MAX_AGE)
+
+
+def _route_playlist(event, episode_id):
+    """エピソードのプレイリストを返す"""
+    if not _EPISODE_ID_RE.fullmatch(episode_id):
+        return build_response(400, _INVALID_EPISODE_ID_BODY)
+    return _cacheable_response(event, get_playlist(episode_id), EPISODE_MAX_AGE)
+
+
+def _route_article_audio(event, article_id):
+    """記事の音声URLを返す"""
+    # queryStringParametersがNoneの場合にも対応
+    query_params = event.get('queryStringParameters') or {}
+    language = query_params.get('language', 'ja')
+    return get_article_audio(article_id, language)
+
+
+# パラメータを含まないパスのルーティング（パス -> ハンドラー）
+_STATIC_ROUTES = {
+    '/episodes': _route_episodes,
+    '/api/episodes': _route_episodes,
+    '/health': lambda event: get_health(),
+}
+
+# パラメータを含むパスのルーティングテーブル（パスの正規表現, ハンドラー）
+# 正規表現の名前付きグループがハンドラーのキーワード引数として渡される
+_ROUTES = [
+    (re.compile(r'(?:/api)?/episodes/(?P<episode_id>[^/]+)/playlist$'), _route_playlist),
+    (re.compile(r'(?:/api)?/episodes/(?P<episode_id>[^/]+)$'), _route_episode),
+    (re.compile(r'/api/articles/(?P<article_id>[^/]+)/audio$'), _route_article_audio),
+]
 
 
 def handle_request(event, context=None):
@@ -482,57 +1047,39 @@ def handle_request(event, context=None):
 
         # CORSプリフライトリクエスト対応
         if http_method == 'OPTIONS':
-            return build_response(200, {})
+            return _OPTIONS_RESPONSE
 
         # GET以外のメソッドは拒否
         if http_method != 'GET':
-            return build_response(405, {"error": "Method not allowed"})
+            return _METHOD_NOT_ALLOWED_RESPONSE
 
         # /audio/以下のパスリクエストは音声プロキシに転送
         if path.startswith('/audio/'):
             # audio_proxy.pyのlambda_handlerを呼び出す
             # パスからファイルパスを抽出 (/audio/filename.mp3 -> filename.mp3)
-            file_path = path[7:]  # "/audio/"の部分を削除
-
-            # audio_proxyに必要なパラメータを設定
-            proxy_event = event.copy()
-            # pathParametersが存在しない場合は作成
-            if 'pathParameters' not in proxy_event or not proxy_event['pathParameters']:
-                proxy_event['pathParameters'] = {}
+            file_path = path.removeprefix('/audio/')
 
-            proxy_event['pathParameters']['file_path'] = file_path
+            # audio_proxyに必要なパラメータだけを持つイベントを構築
+            # （元のイベント全体をコピー・変更しない）
+            proxy_event = {
+                'pathParameters': {'file_path': file_path},
+                'headers': event.get('headers') or {}
+            }
 
             # オーディオプロキシハンドラを呼び出し
-            logger.info(f"Routing to audio proxy handler: {file_path}")
+            logger.info("Routing to audio proxy handler: %s", file_path)
             return audio_proxy_handler(proxy_event, context)
 
-        # パスによるルーティング
-        if path == '/episodes' or path == '/api/episodes':
-            return get_episodes()
-        elif path.startswith('/episodes/') or path.startswith('/api/episodes/'):
-            # エピソードIDのみか、playlist指定かを判定
-            path_parts = path.split('/')
-            # パスの末尾がplaylistの場合
-            if path_parts[-1] == 'playlist':
-                episode_id = path_parts[-2]
-                return get_playlist(episode_id)
-            # 通常のエピソード取得
-            else:
-                episode_id = path_parts[-1]
-                return get_episode(episode_id)
-        elif path.startswith('/api/articles/') and path.endswith('/audio'):
-            # /api/articles/{article_id}/audio 形式から抽出
-            article_id = path.split('/')[-2]
-            # queryStringParametersがNoneの場合にも対応
-            query_params = event.get('queryStringParameters') or {}
-            language = query_params.get('language', 'ja')
-            return get_article_audio(article_id, language)
-        elif path == '/health':
-            return get_health()
-        else:
-            return build_response(404, {"error": "Not found"})
+        # パスによるルーティング（完全一致を先に辞書で引く）
+        handler = _STATIC_ROUTES.get(path)
+        if handler:
+            return handler(event)
+        for pattern, handler in _ROUTES:
+            match = pattern.match(path)
+            if match:
+                return handler(event, **match.groupdict())
+        return _NOT_FOUND_RESPONSE
 
     except Exception as e:
-        logger.error(f"リクエスト処理エラー: {str(e)}")
-        logger.error(traceback.format_exc())
-        return build_response(500, {"error": "Internal server error"})
+        logger.exception("リクエスト処理エラー: %s", e)
+        return build_response(500, _INTERNAL_ERROR_BODY)
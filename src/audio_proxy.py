@@ -1,89 +1,474 @@
 import json
 import os
 import logging
-import boto3
 import base64
-from botocore.exceptions import ClientError
-import traceback
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from functools import lru_cache
+from botocore.exceptions import BotoCoreError, ClientError
 
 from src.config import (
-    IS_LAMBDA, CORS_HEADERS, LOCAL_AUDIO_DIR, S3_BUCKET
+    IS_LAMBDA, CORS_HEADERS, LOG_LEVEL, LOCAL_AUDIO_DIR, LOCAL_AUDIO_DIR_PARENT,
+    LOCAL_NARRATION_DIR, S3_BUCKET, CLOUDFRONT_DOMAIN, AUDIO_REDIRECT, get_s3_client
 )
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(LOG_LEVEL)
+
+# S3キー索引（プレフィックス -> (取得時刻, そのプレフィックス配下のキー集合) のLRU）
+# エピソード単位など狭いプレフィックスを一覧取得し、キーごとのHEADリクエストの代わりに存在を判定する
+# 一覧取得はprime_s3_key_indexを呼んだリクエストの中だけで行い、索引にないキーはHEADで確認する
+S3_KEY_INDEX_TTL = 30  # 秒
+S3_KEY_INDEX_SIZE = 256
+# 一覧取得するページ数の上限（1ページ最大1000件）。超える場合は索引に使わない
+S3_KEY_INDEX_MAX_PAGES = 2
+_s3_key_index = OrderedDict()
+_s3_key_index_lock = threading.Lock()
+
+# 音声ファイルのキー・パスの先頭に付く/audio/またはaudio/
+_AUDIO_PREFIX_RE = re.compile(r'/?audio/')
+
+# 音声ファイルのS3キーの候補（可能性の高い順）
+# {key}はプレフィックスを除去したキー、{name}はそのファイル名部分
+_KEY_TEMPLATES = (
+    "{key}",
+    "audio/{key}",
+    "data/audio/{key}",
+    "narration/{key}",
+    "data/narration/{key}",
+    # キーが既にサブディレクトリを含む場合（narration/file.mp3など）
+    "data/{key}",
+    "audio/{name}",
+    "data/audio/{name}",
+    "narration/{name}",
+    "data/narration/{name}",
+)
 
-# S3クライアント（Lambda環境でのみ初期化）
-s3_client = boto3.client('s3') if IS_LAMBDA else None
+# ローカルの音声ファイルの拡張子 -> Content-Type（該当しない場合はaudio/mpeg）
+_EXT_TO_MIME = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.ogg': 'audio/ogg',
+    '.m4a': 'audio/mp4',
+}
 
+# リダイレクト先URLの有効期限（秒）。リダイレクト自体は残り有効期間の下限（半分）までキャッシュを許可する
+AUDIO_REDIRECT_EXPIRATION = 3600
 
-def generate_presigned_url(audio_key, expiration=3600):
-    """S3オブジェクトの署名付きURLを生成する
+# 署名付きURLのキャッシュ件数（有効期限の半分ごとに再生成するため、返すURLの残り有効期間は常に半分以上）
+PRESIGNED_URL_CACHE_SIZE = 4096
+
+
+def _list_s3_keys(prefix):
+    """プレフィックス配下のS3キーを一覧取得
 
     Args:
-        audio_key: 音声ファイルのS3キー
-        expiration: URL有効期限（秒）
+        prefix: 一覧取得するプレフィックス
 
     Returns:
-        str: 署名付きURL、またはNone（エラー時）
+        frozenset: S3キーの集合（ページ数がS3_KEY_INDEX_MAX_PAGESを超える場合はNone）
     """
-    if not IS_LAMBDA or not s3_client:
-        return None
+    paginator = get_s3_client().get_paginator('list_objects_v2')
+    keys = set()
+    for pages, page in enumerate(paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix), 1):
+        if pages > S3_KEY_INDEX_MAX_PAGES:
+            logger.warning("S3キー索引の対象が多すぎるため一覧を使いません: %s", prefix)
+            return None
+        keys.update(obj['Key'] for obj in page.get('Contents', []))
+    return frozenset(keys)
 
-    # ファイルパスのクリーニング
-    if audio_key.startswith('/audio/'):
-        audio_key = audio_key[7:]
-    elif audio_key.startswith('audio/'):
-        audio_key = audio_key[6:]
+
+def _index_prefixes(audio_keys):
+    """音声ファイルのキーをまとめて覆う、ディレクトリごとの最長の共通プレフィックスを求める
+
+    Args:
+        audio_keys: 音声ファイルのS3キーのリスト
+
+    Returns:
+        list: 一覧取得するプレフィックスのリスト
+    """
+    names_by_dir = {}
+    for audio_key in audio_keys:
+        directory, _, name = audio_key.lstrip('/').rpartition('/')
+        names_by_dir.setdefault(directory, []).append(name)
+
+    prefixes = []
+    for directory, names in names_by_dir.items():
+        # ディレクトリのないファイル名や、共通部分のないファイル名（ディレクトリ全体の一覧になる場合）は対象にしない
+        common = os.path.commonprefix(names)
+        if directory and common:
+            prefixes.append(f"{directory}/{common}")
+    return prefixes
+
+
+def prime_s3_key_index(audio_keys):
+    """これから署名する音声ファイルのキーを含むプレフィックスを一覧取得し、S3キー索引に登録する
+
+    エピソード詳細などで複数の音声URLを並列に変換する前に呼び出し、
+    キーごとのHEADリクエストを狭いプレフィックスの一覧取得（通常1ページ）に置き換える。
+    一覧取得に失敗した場合は索引に登録せず、各キーはHEADで確認される。
+
+    Args:
+        audio_keys: 音声ファイルのS3キーのリスト
+    """
+    if not IS_LAMBDA:
+        return
+
+    now = time.monotonic()
+    for prefix in _index_prefixes(audio_keys):
+        with _s3_key_index_lock:
+            cached = _s3_key_index.get(prefix)
+            if cached and now - cached[0] < S3_KEY_INDEX_TTL:
+                _s3_key_index.move_to_end(prefix)
+                continue
+
+        try:
+            keys = _list_s3_keys(prefix)
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("S3キー索引の取得に失敗: %s (%s)", prefix, e)
+            continue
+        if keys is None:
+            continue
+
+        with _s3_key_index_lock:
+            _s3_key_index[prefix] = (time.monotonic(), keys)
+            _s3_key_index.move_to_end(prefix)
+            while len(_s3_key_index) > S3_KEY_INDEX_SIZE:
+                _s3_key_index.popitem(last=False)
+
+
+def _lookup_s3_key_index(s3_key, listings, now):
+    """S3キー索引でキーの存在を判定
+
+    Args:
+        s3_key: S3キー
+        listings: S3キー索引の(プレフィックス, (取得時刻, キー集合))のリスト
+        now: 現在時刻（time.monotonic）
+
+    Returns:
+        bool: 存在する場合True、存在しない場合False、索引の対象外の場合None
+    """
+    for prefix, (loaded_at, keys) in listings:
+        if s3_key.startswith(prefix) and now - loaded_at < S3_KEY_INDEX_TTL:
+            return s3_key in keys
+    return None
+
+
+def _forget_s3_key(s3_key):
+    """S3キー索引から削除されたオブジェクトのキーを取り除く
+
+    GETでNoSuchKeyが返った場合に呼び出し、以降の確認で存在しないと判定させる。
+
+    Args:
+        s3_key: S3キー
+    """
+    with _s3_key_index_lock:
+        for prefix, (loaded_at, keys) in list(_s3_key_index.items()):
+            if s3_key.startswith(prefix) and s3_key in keys:
+                _s3_key_index[prefix] = (loaded_at, keys - {s3_key})
+
+
+def _normalize_audio_key(audio_key):
+    """音声ファイルのキー・パスから不要な部分を取り除く
+
+    Args:
+        audio_key: 音声ファイルのキーまたはパス
+
+    Returns:
+        str: 先頭の/audio/（audio/）を除去し、URLの場合はファイル名のみにしたキー
+    """
+    match = _AUDIO_PREFIX_RE.match(audio_key)
+    if match:
+        audio_key = audio_key[match.end():]
 
     # 「https://」や「http://」が含まれている場合はファイル名のみ抽出
     if 'https://' in audio_key or 'http://' in audio_key:
-        audio_key = audio_key.split('/')[-1]
-
-    # 可能性のあるS3キーパターン
-    s3_keys_to_try = [
-        audio_key,
-        f"audio/{audio_key}",
-        f"data/audio/{audio_key}",
-        f"narration/{audio_key}",
-        f"data/narration/{audio_key}",
-        # audio_keyが既にサブディレクトリを含む場合（narration/file.mp3など）
-        os.path.join("data", audio_key),
-        os.path.join("audio", os.path.basename(audio_key)),
-        os.path.join("data/audio", os.path.basename(audio_key)),
-        os.path.join("narration", os.path.basename(audio_key)),
-        os.path.join("data/narration", os.path.basename(audio_key))
-    ]
+        audio_key = audio_key.rpartition('/')[2]
+    return audio_key
+
+
+def _candidate_s3_keys(audio_key):
+    """音声ファイルのS3キーの候補を列挙する
+
+    Args:
+        audio_key: プレフィックスを除去した音声ファイルのキー
+
+    Returns:
+        list: S3キーの候補リスト（可能性の高い順、重複なし）
+    """
+    name = audio_key.rpartition('/')[2]
+    # dict.fromkeysで順序を保ったまま重複を除去する
+    return list(dict.fromkeys(
+        template.format(key=audio_key, name=name) for template in _KEY_TEMPLATES))
+
+
+def _resolve_s3_key(s3_keys_to_try):
+    """候補のS3キーのうち、実在するキーを特定する
+
+    まずS3キー索引で判定し、索引の対象外の候補だけをHEADリクエストで確認する。
+
+    Args:
+        s3_keys_to_try: S3キーの候補リスト
 
-    # 重複するキーを削除
-    s3_keys_to_try = list(set(s3_keys_to_try))
+    Returns:
+        str: 実在するS3キー（見つからない場合はNone）
 
-    # 各キーで署名付きURLの生成を試みる
+    Raises:
+        BotoCoreError: 接続エラーやタイムアウトでS3に問い合わせられない場合
+    """
+    with _s3_key_index_lock:
+        listings = list(_s3_key_index.items())
+    now = time.monotonic()
+
+    unindexed = []
     for s3_key in s3_keys_to_try:
+        found = _lookup_s3_key_index(s3_key, listings, now)
+        if found:
+            return s3_key
+        if found is None:
+            unindexed.append(s3_key)
+
+    s3_client = get_s3_client()
+    for s3_key in unindexed:
         try:
-            # まずオブジェクトが存在するか確認
             s3_client.head_object(Bucket=S3_BUCKET, Key=s3_key)
-
-            # 署名付きURLを生成
-            url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': S3_BUCKET,
-                    'Key': s3_key
-                },
-                ExpiresIn=expiration
-            )
-            logger.info(f"署名付きURL生成成功: {s3_key}")
-            return url
+            return s3_key
         except ClientError as e:
             # オブジェクトが存在しない場合は次のキーを試す
-            logger.debug(f"S3キー {s3_key} での署名付きURL生成失敗: {str(e)}")
-            continue
+            # （接続エラーやタイムアウトのBotoCoreErrorは「存在しない」と区別するため呼び出し元へ送る）
+            logger.debug("S3キー %s が見つかりません: %s", s3_key, e)
+    return None
+
+
+@lru_cache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+def _presign_for_window(s3_key, expiration, window):
+    """時間枠ごとに署名付きURLを生成してキャッシュする
+
+    Args:
+        s3_key: S3キー
+        expiration: URL有効期限（秒）
+        window: 有効期限の半分を単位とした時間枠（キャッシュキーとしてのみ使用）
+
+    Returns:
+        str: 署名付きURL
+    """
+    return get_s3_client().generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': S3_BUCKET,
+            'Key': s3_key
+        },
+        ExpiresIn=expiration
+    )
+
+
+def _url_for_s3_key(s3_key, expiration):
+    """実在するS3キーの配信用URLを生成する
+
+    Args:
+        s3_key: S3キー
+        expiration: URL有効期限（秒）
+
+    Returns:
+        str: CloudFrontのURLまたは署名付きURL、またはNone（エラー時）
+    """
+    # CloudFront経由で配信する場合は署名せずにCloudFrontのURLを返す
+    if CLOUDFRONT_DOMAIN:
+        url = f"https://{CLOUDFRONT_DOMAIN}/{urllib.parse.quote(s3_key)}"
+        logger.debug("CloudFront URL生成成功: %s", s3_key)
+        return url
+
+    try:
+        window = int(time.time()) // max(expiration // 2, 1)
+        url = _presign_for_window(s3_key, expiration, window)
+        logger.debug("署名付きURL生成成功: %s", s3_key)
+        return url
+    except ClientError as e:
+        logger.debug("S3キー %s での署名付きURL生成失敗: %s", s3_key, e)
+        return None
+
+
+def generate_presigned_url(audio_key, expiration=3600):
+    """S3オブジェクトの署名付きURLを生成する
+
+    Args:
+        audio_key: 音声ファイルのS3キー
+        expiration: URL有効期限（秒）
+
+    Returns:
+        str: 署名付きURL、またはNone（エラー時）
+    """
+    if not IS_LAMBDA:
+        return None
 
-    logger.warning(f"すべてのS3キーパターンで署名付きURL生成に失敗: {audio_key}")
+    audio_key = _normalize_audio_key(audio_key)
+
+    # 実在するキーを特定して署名付きURLを生成
+    try:
+        s3_key = _resolve_s3_key(_candidate_s3_keys(audio_key))
+    except BotoCoreError as e:
+        logger.warning("S3キーの確認に失敗: %s (%s)", audio_key, e)
+        return None
+    if s3_key:
+        url = _url_for_s3_key(s3_key, expiration)
+        if url:
+            return url
+
+    logger.warning("すべてのS3キーパターンで署名付きURL生成に失敗: %s", audio_key)
     return None
 
 
+def _error_response(status_code, message):
+    """エラーレスポンスを構築
+
+    Args:
+        status_code: HTTPステータスコード
+        message: エラーメッセージ
+
+    Returns:
+        dict: API Gatewayレスポンス
+    """
+    return {
+        'statusCode': status_code,
+        'headers': CORS_HEADERS,
+        'body': json.dumps({'error': message})
+    }
+
+
+def _file_response(file_content, content_type):
+    """音声ファイルの内容をBase64エンコードしたレスポンスを構築
+
+    Args:
+        file_content: ファイルの内容
+        content_type: Content-Type
+
+    Returns:
+        dict: API Gatewayレスポンス
+    """
+    # ファイルの内容が取得できていることを確認
+    if not file_content:
+        return _error_response(404, 'File content is empty')
+
+    # APIレスポンスを作成
+    response_headers = {
+        'Content-Type': content_type,
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Allow-Methods': 'OPTIONS,GET',
+        'Cache-Control': 'public, max-age=86400'  # 1日のキャッシュを許可
+    }
+
+    return {
+        'statusCode': 200,
+        'headers': response_headers,
+        'body': base64.b64encode(file_content).decode('ascii'),
+        'isBase64Encoded': True
+    }
+
+
+def _get_audio_file_s3(file_path):
+    """S3から音声ファイルを取得してレスポンスを返す（Lambda環境）
+
+    Args:
+        file_path: 正規化済みのファイルパス
+
+    Returns:
+        dict: API Gatewayレスポンス
+    """
+    # 実在するキーを特定し、GETは1回だけ行う
+    try:
+        s3_key = _resolve_s3_key(_candidate_s3_keys(file_path))
+    except BotoCoreError as e:
+        # S3の障害をファイルの不在（404）として返さない
+        logger.error("S3 connection error while resolving %s: %s", file_path, e)
+        return _error_response(503, 'Storage temporarily unavailable')
+    if not s3_key:
+        logger.error("All S3 keys failed for file: %s", file_path)
+        return _error_response(404, f'File not found: {file_path}')
+
+    # リダイレクトモードではファイル本体をLambdaで中継しない
+    if AUDIO_REDIRECT:
+        url = _url_for_s3_key(s3_key, AUDIO_REDIRECT_EXPIRATION)
+        if url:
+            return {
+                'statusCode': 302,
+                'headers': {
+                    **CORS_HEADERS,
+                    'Location': url,
+                    'Cache-Control': f'public, max-age={AUDIO_REDIRECT_EXPIRATION // 2}'
+                },
+                'body': ''
+            }
+
+    try:
+        response = get_s3_client().get_object(Bucket=S3_BUCKET, Key=s3_key)
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        logger.error("S3 ClientError for key %s (%s): %s",
+                     s3_key, error_code, e.response['Error']['Message'])
+        if error_code == 'NoSuchKey':
+            # 索引の取得後に削除されたオブジェクトは索引からも取り除く
+            _forget_s3_key(s3_key)
+        return _error_response(404 if error_code == 'NoSuchKey' else 500,
+                               f'File not found: {file_path}')
+    except BotoCoreError as e:
+        logger.error("S3 connection error for key %s: %s", s3_key, e)
+        return _error_response(503, 'Storage temporarily unavailable')
+
+    # Content-Typeを取得
+    content_type = response.get('ContentType', 'audio/mpeg')
+
+    # ファイル内容を取得
+    file_content = response['Body'].read()
+    logger.info("Successfully retrieved file from S3: %s, %d bytes, content-type: %s",
+                s3_key, len(file_content), content_type)
+    return _file_response(file_content, content_type)
+
+
+def _get_audio_file_local(file_path):
+    """ローカルファイルシステムから音声ファイルを読み込んでレスポンスを返す
+
+    Args:
+        file_path: 正規化済みのファイルパス
+
+    Returns:
+        dict: API Gatewayレスポンス
+    """
+    # 色々なパターンを試してみる
+    file_name = os.path.basename(file_path)
+    paths_to_try = [
+        os.path.join(LOCAL_AUDIO_DIR, file_path),
+        os.path.join(LOCAL_AUDIO_DIR, file_name),
+        os.path.join(LOCAL_AUDIO_DIR_PARENT, file_path),
+        os.path.join(LOCAL_NARRATION_DIR, file_path),
+        os.path.join(LOCAL_NARRATION_DIR, file_name)
+    ]
+
+    for local_file_path in paths_to_try:
+        logger.debug("Trying to read local file: %s", local_file_path)
+        # isfileは存在確認も兼ねるため、statは1回で済む
+        if os.path.isfile(local_file_path):
+            # ファイルの拡張子からContent-Typeを判断
+            content_type = _EXT_TO_MIME.get(
+                os.path.splitext(local_file_path)[1].lower(), 'audio/mpeg')
+
+            # ファイルを読み込む
+            with open(local_file_path, 'rb') as file:
+                file_content = file.read()
+            logger.info("Successfully read local file: %d bytes", len(file_content))
+            return _file_response(file_content, content_type)
+
+    logger.error("Local file not found at any tried path for: %s", file_path)
+    return _error_response(404, f'File not found: {file_path}')
+
+
+# 実行環境に応じた取得処理はモジュール読み込み時に一度だけ選ぶ
+_get_audio_file = _get_audio_file_s3 if IS_LAMBDA else _get_audio_file_local
+
+
 def lambda_handler(event, context):
     """S3バケットまたはローカルファイルシステムから音声ファイルを取得して返す
 
@@ -96,178 +481,33 @@ def lambda_handler(event, context):
     """
     try:
         # パスパラメータからファイルキーを取得
-        if 'pathParameters' in event and event['pathParameters']:
-            file_path = event['pathParameters'].get('file_path', '')
+        path_parameters = event.get('pathParameters')
+        if path_parameters:
+            file_path = path_parameters.get('file_path', '')
         else:
-            return {
-                'statusCode': 400,
-                'headers': CORS_HEADERS,
-                'body': json.dumps({'error': 'Missing file path parameter'})
-            }
-
-        # イベント情報をデバッグログに出力
-        logger.info(f"Audio proxy event: {json.dumps(event)}")
-        logger.info(f"Requested file path: {file_path}")
-
-        # ファイルパスのバリデーション（セキュリティ対策）
-        if not file_path or '..' in file_path:
-            return {
-                'statusCode': 400,
-                'headers': CORS_HEADERS,
-                'body': json.dumps({'error': 'Invalid file path'})
-            }
+            return _error_response(400, 'Missing file path parameter')
 
-        # ファイルパスから不要なプレフィックスをクリーニング
-        # /audio/が先頭にある場合は削除
-        if file_path.startswith('/audio/'):
-            file_path = file_path[7:]
-        elif file_path.startswith('audio/'):
-            file_path = file_path[6:]
+        # イベント情報をデバッグログに出力（イベント全体のシリアライズはDEBUG時のみ）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Audio proxy event: %s", json.dumps(event))
+        logger.debug("Requested file path: %s", file_path)
 
         # URLエンコードされた文字をデコード
         if '%' in file_path:
-            try:
-                import urllib.parse
-                file_path = urllib.parse.unquote(file_path)
-                logger.info(f"Path after URL decode: {file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to URL decode path: {str(e)}")
-
-        # 「https://」や「http://」が含まれている場合はファイル名のみ抽出
-        if 'https://' in file_path or 'http://' in file_path:
-            file_path = file_path.split('/')[-1]
-            logger.info(f"Extracted filename from URL: {file_path}")
-
-        logger.info(f"Retrieving audio file (cleaned path): {file_path}")
-
-        # ファイルの内容を取得
-        file_content = None
-        content_type = 'audio/mpeg'
-
-        if IS_LAMBDA:
-            # Lambda環境: S3からファイルを取得
-            # 複数のパターンを試す
-            s3_keys_to_try = [
-                file_path,
-                f"audio/{file_path}",
-                f"data/audio/{file_path}",
-                f"narration/{file_path}",
-                f"data/narration/{file_path}",
-                # file_pathが既にサブディレクトリを含む場合（narration/file.mp3など）
-                os.path.join("data", file_path),
-                os.path.join("audio", os.path.basename(file_path)),
-                os.path.join("data/audio", os.path.basename(file_path)),
-                os.path.join("narration", os.path.basename(file_path)),
-                os.path.join("data/narration", os.path.basename(file_path))
-            ]
-
-            # 重複するキーを削除
-            s3_keys_to_try = list(set(s3_keys_to_try))
-
-            file_found = False
-            last_error = None
-
-            for s3_key in s3_keys_to_try:
-                try:
-                    logger.info(f"Trying S3 key: {s3_key}")
-                    response = s3_client.get_object(
-                        Bucket=S3_BUCKET,
-                        Key=s3_key
-                    )
-
-                    # Content-Typeを取得
-                    content_type = response.get('ContentType', 'audio/mpeg')
-
-                    # ファイル内容を取得
-                    file_content = response['Body'].read()
-                    logger.info(
-                        f"Successfully retrieved file from S3: {s3_key}, {len(file_content)} bytes, content-type: {content_type}")
-                    file_found = True
-                    break
-                except ClientError as e:
-                    error_code = e.response['Error']['Code']
-                    error_message = e.response['Error']['Message']
-                    logger.info(
-                        f"S3 ClientError for key {s3_key} ({error_code}): {error_message}")
-                    last_error = e
-
-            if not file_found:
-                logger.error(f"All S3 keys failed for file: {file_path}")
-                if last_error:
-                    error_code = last_error.response['Error']['Code']
-                    return {
-                        'statusCode': 404 if error_code == 'NoSuchKey' else 500,
-                        'headers': CORS_HEADERS,
-                        'body': json.dumps({'error': f'File not found: {file_path}'})
-                    }
-        else:
-            # ローカル環境: ローカルファイルシステムからファイルを読み込む
-            # 色々なパターンを試してみる
-            paths_to_try = [
-                os.path.join(LOCAL_AUDIO_DIR, file_path),
-                os.path.join(LOCAL_AUDIO_DIR, os.path.basename(file_path)),
-                os.path.join(os.path.dirname(LOCAL_AUDIO_DIR),
-                             'local_audio', file_path),
-                os.path.join(os.path.dirname(LOCAL_AUDIO_DIR), file_path),
-                os.path.join(LOCAL_AUDIO_DIR, 'narration', file_path),
-                os.path.join(LOCAL_AUDIO_DIR, 'narration',
-                             os.path.basename(file_path))
-            ]
-
-            file_found = False
-            for local_file_path in paths_to_try:
-                logger.info(f"Trying to read local file: {local_file_path}")
-                if os.path.exists(local_file_path) and os.path.isfile(local_file_path):
-                    # ファイルの拡張子からContent-Typeを判断
-                    if local_file_path.endswith('.wav'):
-                        content_type = 'audio/wav'
-
-                    # ファイルを読み込む
-                    with open(local_file_path, 'rb') as file:
-                        file_content = file.read()
-                        logger.info(
-                            f"Successfully read local file: {len(file_content)} bytes")
-                        file_found = True
-                        break
-
-            if not file_found:
-                logger.error(
-                    f"Local file not found at any tried path for: {file_path}")
-                return {
-                    'statusCode': 404,
-                    'headers': CORS_HEADERS,
-                    'body': json.dumps({'error': f'File not found: {file_path}'})
-                }
-
-        # ファイルの内容が取得できていることを確認
-        if not file_content:
-            return {
-                'statusCode': 404,
-                'headers': CORS_HEADERS,
-                'body': json.dumps({'error': 'File content is empty'})
-            }
+            file_path = urllib.parse.unquote(file_path)
+            logger.info("Path after URL decode: %s", file_path)
+
+        # ファイルパスから不要なプレフィックスやURLスキームを取り除く
+        file_path = _normalize_audio_key(file_path)
+
+        # ファイルパスのバリデーション（セキュリティ対策）
+        # URLデコード後に確認し、エンコードされた「..」も拒否する
+        if not file_path or '..' in file_path:
+            return _error_response(400, 'Invalid file path')
 
-        # APIレスポンスを作成
-        response_headers = {
-            'Content-Type': content_type,
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type',
-            'Access-Control-Allow-Methods': 'OPTIONS,GET',
-            'Cache-Control': 'public, max-age=86400'  # 1日のキャッシュを許可
-        }
-
-        return {
-            'statusCode': 200,
-            'headers': response_headers,
-            'body': base64.b64encode(file_content).decode('utf-8'),
-            'isBase64Encoded': True
-        }
+        logger.info("Retrieving audio file (cleaned path): %s", file_path)
+        return _get_audio_file(file_path)
 
     except Exception as e:
-        logger.error(f"Unexpected error in audio proxy: {str(e)}")
-        logger.error(traceback.format_exc())
-        return {
-            'statusCode': 500,
-            'headers': CORS_HEADERS,
-            'body': json.dumps({'error': f'Server error: {str(e)}'})
-        }
+        logger.exception("Unexpected error in audio proxy: %s", e)
+        return _error_response(500, f'Server error: {str(e)}')
@@ -1,19 +1,64 @@
 import os
 import logging
+import threading
+from functools import lru_cache
 
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+
+def get_env_number(name, default, convert=int, minimum=0):
+    """数値の環境変数を取得
+
+    起動時に例外で止まらないよう、数値として解釈できない値や下限未満の値は既定値として扱う。
+
+    Args:
+        name: 環境変数名
+        default: 既定値
+        convert: 変換関数（intまたはfloat）
+        minimum: 許容する最小値
+
+    Returns:
+        環境変数の値（不正な場合は既定値）
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        number = convert(value)
+    except ValueError:
+        number = None
+    # NaNは比較が常に偽になるため、下限以上であることを確認する
+    if number is None or not number >= minimum:
+        logger.warning("不正な%s: %s（%sを使用します）", name, value, default)
+        return default
+    return number
+
+
 # 環境設定
 IS_LAMBDA = os.environ.get('AWS_EXECUTION_ENV', '').startswith('AWS_Lambda_')
+# ログレベル（URLごとの詳細ログはDEBUGで出力される）
+# 不正な値でsetLevelが例外にならないよう、未知のレベル名はINFOとして扱う
+_log_level = (os.environ.get('LOG_LEVEL') or 'INFO').upper()
+if _log_level in logging.getLevelNamesMapping():
+    LOG_LEVEL = _log_level
+else:
+    logger.warning("不正なLOG_LEVEL: %s（INFOを使用します）", _log_level)
+    LOG_LEVEL = 'INFO'
 
 # ローカル開発用設定
 LOCAL_HOST = '127.0.0.1'
 LOCAL_PORT = 5001
+# ローカル環境で音声ファイルを配信するURLのプレフィックス
+LOCAL_AUDIO_URL_PREFIX = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/"
 LOCAL_DATA_DIR = os.path.join(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__))), 'local_data')
 LOCAL_AUDIO_DIR = os.path.join(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__))), 'local_audio')
+LOCAL_AUDIO_DIR_PARENT = os.path.dirname(LOCAL_AUDIO_DIR)
+LOCAL_NARRATION_DIR = os.path.join(LOCAL_AUDIO_DIR, 'narration')
+# nginxの背後で動かす場合、音声ファイルの転送をX-Accel-Redirectで任せる内部ロケーション（例: /protected_audio/）
+LOCAL_AUDIO_ACCEL_REDIRECT = os.environ.get('LOCAL_AUDIO_ACCEL_REDIRECT', '')
 
 # AWS環境用設定
 S3_BUCKET = os.environ.get(
@@ -22,6 +67,13 @@ S3_BUCKET = os.environ.get(
 S3_PREFIX = os.environ.get('S3_PREFIX', 'data/audio/')
 # メタデータは data/metadata/...
 S3_METADATA_PREFIX = os.environ.get('S3_METADATA_PREFIX', 'data/metadata/')
+# Lambda実行環境ではAWS_REGIONが自動で設定される（未設定時はboto3の既定の解決に任せる）
+AWS_REGION = os.environ.get('AWS_REGION') or None
+# 音声ファイルをCloudFront経由で配信する場合のドメイン（例: dxxxx.cloudfront.net）
+# 設定時は署名付きURLの代わりにCloudFrontのURLを返す（アクセス制御はCloudFront側で行う）
+CLOUDFRONT_DOMAIN = os.environ.get('CLOUDFRONT_DOMAIN', '')
+# 音声プロキシ（/audio/...）でファイル本体を返さず、署名付きURL（またはCloudFrontのURL）へ302リダイレクトする
+AUDIO_REDIRECT = os.environ.get('AUDIO_REDIRECT', 'false').lower() == 'true'
 
 # 共通設定
 CORS_HEADERS = {
@@ -30,6 +82,56 @@ CORS_HEADERS = {
     'Access-Control-Allow-Methods': 'OPTIONS,GET'
 }
 
+# S3クライアントのコネクションプール上限（署名付きURL生成・取得の並列数を上回るように設定）
+S3_MAX_POOL_CONNECTIONS = get_env_number('S3_MAX_POOL', 64, minimum=1)
+
+# S3クライアント（初回利用時に生成し、モジュール間で共有する）
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """共有S3クライアントを取得
+
+    boto3のインポートとクライアント生成は初回呼び出しまで遅延させ、
+    コールドスタート時の初期化時間を短縮する。
+
+    Returns:
+        S3クライアント
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        # 並列実行中のスレッドから同時に呼ばれても生成は一度だけ行う
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+                from botocore.config import Config
+                # TCPキープアライブで接続を再利用し、リトライは標準モードで回数を抑える
+                # リージョンは明示し、初回呼び出し時のリージョン解決を省く
+                _s3_client = boto3.client('s3', region_name=AWS_REGION, config=Config(
+                    tcp_keepalive=True,
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={'mode': 'standard', 'max_attempts': 2}
+                ))
+    return _s3_client
+
+
+def warm_up_s3_connection():
+    """S3クライアントの生成と署名処理を事前に準備する
+
+    Lambdaの初期化時に呼び出し、最初のリクエストでクライアント生成や
+    署名器の読み込みの待ち時間が発生しないようにする。失敗しても初期化は継続する。
+    S3へのネットワークアクセスは行わない（応答が遅い場合に初期化を止めないため）。
+    """
+    try:
+        s3_client = get_s3_client()
+        # 署名付きURLの生成はローカル処理のみで、ネットワークアクセスは発生しない
+        s3_client.generate_presigned_url(
+            'get_object', Params={'Bucket': S3_BUCKET, 'Key': '__warmup__'}, ExpiresIn=1)
+    except Exception as e:
+        logger.warning("S3クライアントの事前準備に失敗: %s", e)
+
 # ファイルパス設定（環境によって切り替え）
 
 
@@ -66,6 +168,7 @@ def get_episodes_data_path(episode_id=None):
         return LOCAL_DATA_DIR
 
 
+@lru_cache(maxsize=1024)
 def get_metadata_path(episode_id):
     """エピソードIDに基づくメタデータファイルのパスを取得
 
@@ -85,6 +188,7 @@ def get_metadata_path(episode_id):
         return os.path.join(metadata_dir, f"metadata_{episode_id}.json")
 
 
+@lru_cache(maxsize=1)
 def get_episodes_list_path():
     """エピソード一覧ファイルのパスを取得
 
@@ -99,6 +203,27 @@ def get_episodes_list_path():
         return os.path.join(LOCAL_DATA_DIR, "episodes_list.json")
 
 
+# audio_proxyの署名付きURL生成関数（audio_proxyがconfigをインポートするため、初回利用時に読み込む）
+_generate_presigned_url = None
+
+
+def _get_presign_function():
+    """audio_proxyの署名付きURL生成関数を取得
+
+    Returns:
+        function: generate_presigned_url
+
+    Raises:
+        ImportError: audio_proxyを読み込めない場合
+    """
+    global _generate_presigned_url
+
+    if _generate_presigned_url is None:
+        from src.audio_proxy import generate_presigned_url
+        _generate_presigned_url = generate_presigned_url
+    return _generate_presigned_url
+
+
 def build_audio_url(audio_key):
     """音声ファイルのURLを構築
 
@@ -108,38 +233,31 @@ def build_audio_url(audio_key):
     Returns:
         str: 音声ファイルのURL
     """
-    # デバッグ出力
-    logger.debug(f"build_audio_url入力: {audio_key}")
-
     # audio_keyがNoneまたは空文字列の場合
     if not audio_key:
         logger.warning("build_audio_url: 空の音声キーが渡されました")
         return None
 
-    # 既にhttps://を含む完全なURLの場合（署名付きURLなど）はそのまま返す
+    # 既にhttps://を含む完全なURLの場合（署名付きURLなど）はログ出力もせずそのまま返す
     if isinstance(audio_key, str) and audio_key.startswith(('https://', 'http://')):
-        logger.debug(f"完全なURLが既に指定されています: {audio_key}")
         return audio_key
 
+    # デバッグ出力
+    logger.debug("build_audio_url入力: %s", audio_key)
+
     if IS_LAMBDA:
         # Lambda環境では署名付きURLを生成
         try:
-            # audio_proxy.pyの関数をインポート
-            from src.audio_proxy import generate_presigned_url
-            
             # 署名付きURLを生成（1時間有効）
-            presigned_url = generate_presigned_url(audio_key, expiration=3600)
+            presigned_url = _get_presign_function()(audio_key, expiration=3600)
             if presigned_url:
-                logger.debug(f"署名付きURL生成成功: {presigned_url}")
+                logger.debug("署名付きURL生成成功: %s", presigned_url)
                 return presigned_url
                 
             # 署名付きURL生成に失敗した場合は相対パスを返す
-            logger.warning(f"署名付きURL生成失敗。相対パスを返します: {audio_key}")
+            logger.warning("署名付きURL生成失敗。相対パスを返します: %s", audio_key)
             
-            if audio_key.startswith('/'):
-                audio_path = audio_key[1:]  # 先頭の/を削除
-            else:
-                audio_path = audio_key
+            audio_path = audio_key.removeprefix('/')  # 先頭の/を削除
 
             # audio/プレフィックスがない場合は追加（ただし既に含まれている場合は追加しない）
             if not audio_path.startswith('audio/'):
@@ -147,17 +265,14 @@ def build_audio_url(audio_key):
 
             # 相対パスを返す
             url = f"{audio_path}"
-            logger.debug(f"生成された相対パス: {url}")
+            logger.debug("生成された相対パス: %s", url)
             return url
                 
         except ImportError as e:
-            logger.warning(f"署名付きURL生成関数のインポートに失敗: {str(e)}")
+            logger.warning("署名付きURL生成関数のインポートに失敗: %s", e)
             # フォールバック処理として相対パスを返す
-            if audio_key.startswith('/'):
-                audio_path = audio_key[1:]
-            else:
-                audio_path = audio_key
-                
+            audio_path = audio_key.removeprefix('/')
+
             if not audio_path.startswith('audio/'):
                 audio_path = f"audio/{audio_path}"
                 
@@ -171,6 +286,6 @@ def build_audio_url(audio_key):
         else:
             filename = os.path.basename(audio_key)
             
-        url = f"http://{LOCAL_HOST}:{LOCAL_PORT}/audio/{filename}"
-        logger.debug(f"生成されたローカルURL: {url}")
+        url = LOCAL_AUDIO_URL_PREFIX + filename
+        logger.debug("生成されたローカルURL: %s", url)
         return url